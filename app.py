@@ -7,6 +7,9 @@ from quart import Quart
 from quart_cors import cors
 
 from core.config import FRONTEND_URL, LOG_LEVEL
+from core.auth_api import close_http_client
+from services import drain_background_tasks
+from core.json_provider import ORJSONProvider
 
 # Import all route blueprints
 from routes import (
@@ -65,9 +68,12 @@ def create_app():
 	logger.debug("Starting Concierge Bank API initialization...")
 	app = Quart(__name__)
 	
+	# Serialize jsonify() responses with orjson
+	app.json = ORJSONProvider(app)
+	
 	# Configure CORS
 	logger.debug(f"Configuring CORS with origin: {FRONTEND_URL}")
-	app = cors(app, allow_origin=FRONTEND_URL, allow_credentials=True)
+	app = cors(app, allow_origin=FRONTEND_URL, allow_credentials=True, expose_headers=['X-Next-Cursor'])
 	
 	# Add verbose request/response logging
 	@app.before_request
@@ -85,6 +91,13 @@ def create_app():
 		logger.debug(f"<<< RESPONSE: {request.method} {request.path} -> {response.status_code}")
 		return response
 	
+	# Let background notifications finish, then release pooled HTTP
+	# connections on shutdown
+	@app.after_serving
+	async def close_pooled_clients():
+		await drain_background_tasks()
+		await close_http_client()
+	
 	# Register blueprints
 	logger.debug("Registering blueprints...")
 	app.register_blueprint(auth_bp)
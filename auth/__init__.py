@@ -2,13 +2,18 @@
 Authentication module for Concierge Bank
 """
 from .jwt_handler import create_jwt_token, verify_jwt_token
-from .middleware import get_current_user, require_auth, require_transactions_enabled, require_pin
+from .pin_hashing import hash_pin, verify_pin
+from .middleware import get_current_user, get_user_row, require_auth, require_transactions_enabled, require_pin, verify_transaction_pin
 
 __all__ = [
 	'create_jwt_token',
 	'verify_jwt_token',
 	'get_current_user',
+	'get_user_row',
 	'require_auth',
 	'require_transactions_enabled',
-	'require_pin'
+	'require_pin',
+	'verify_transaction_pin',
+	'hash_pin',
+	'verify_pin'
 ]
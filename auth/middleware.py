@@ -1,11 +1,14 @@
 """
 Authentication middleware
 """
+import asyncio
 import logging
 from functools import wraps
-from typing import Optional, Dict, Any
-from quart import request, jsonify
+from typing import Optional, Dict, Any, Tuple
+from quart import request, jsonify, Response, g
+from utils.validators import is_valid_pin
 from .jwt_handler import verify_jwt_token
+from .pin_hashing import hash_pin, is_pin_hashed, verify_pin
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,34 @@ async def get_current_user() -> Optional[Dict[str, Any]]:
 	return payload
 
 
+# Columns of the caller's users row read by the auth checks and routes
+USER_ROW_COLUMNS = 'id, email, phone, full_name, transaction_pin_hash, transactions_blocked, notification_preferences'
+
+
+async def get_user_row(user_id: str) -> Optional[Dict[str, Any]]:
+	"""Get the current user's users row, fetched at most once per request
+	
+	The row is memoized on quart.g, so decorators and the route handler
+	(e.g. transactions-blocked check, PIN check, email lookup) share a
+	single query. It is never cached across requests.
+	
+	Args:
+		user_id: User's unique identifier
+	
+	Returns:
+		Users row dict or None if not found
+	"""
+	user_row = g.get('user_row')
+	if user_row is not None and user_row.get('id') == user_id:
+		return user_row
+	
+	from core import get_supabase_client, execute_async
+	supabase = get_supabase_client()
+	result = await execute_async(supabase.table('users').select(USER_ROW_COLUMNS).eq('id', user_id).single())
+	g.user_row = result.data or None
+	return g.user_row
+
+
 def require_auth(f):
 	"""Decorator to require authentication for routes
 	
@@ -82,11 +113,9 @@ def require_transactions_enabled(f):
 	async def decorated_function(user, *args, **kwargs):
 		# User is already provided by @require_auth, don't fetch again
 		# Query database for current transaction blocking status
-		from core import get_supabase_client
-		supabase = get_supabase_client()
 		try:
-			user_data = supabase.table('users').select('transactions_blocked').eq('id', user['user_id']).single().execute()
-			transactions_blocked = user_data.data.get('transactions_blocked', False) if user_data.data else False
+			user_row = await get_user_row(user['user_id'])
+			transactions_blocked = user_row.get('transactions_blocked', False) if user_row else False
 		except Exception as e:
 			# If database query fails, default to blocked for security
 			logger.warning(f"Failed to check transaction blocking status for user {user['user_id']}: {e}")
@@ -101,6 +130,59 @@ def require_transactions_enabled(f):
 	return decorated_function
 
 
+async def _upgrade_legacy_pin(user_id: str, pin: str) -> None:
+	"""Replace a plain text PIN with its hash after a successful verification"""
+	from core import get_supabase_client, execute_async
+	from services import invalidate_user_profile
+	supabase = get_supabase_client()
+	pin_hash = await asyncio.to_thread(hash_pin, pin)
+	await execute_async(supabase.table('users').update({'transaction_pin_hash': pin_hash}).eq('id', user_id))
+	invalidate_user_profile(user_id)
+	logger.info(f"Upgraded legacy plain text PIN to a hash for user {user_id}")
+
+
+async def verify_transaction_pin(user_id: str, provided_pin: Any) -> Optional[Tuple[Response, int]]:
+	"""Verify a transaction PIN against the one stored for the user
+	
+	Shared by require_pin and the financial routes that read the PIN from
+	their own request body (transfers, bill payments, check deposits).
+	
+	Args:
+		user_id: User's unique identifier
+		provided_pin: PIN supplied in the request body
+	
+	Returns:
+		None if the PIN is valid, otherwise an (error response, status code) tuple
+	"""
+	if not provided_pin:
+		return jsonify({'error': 'Transaction PIN is required'}), 400
+	
+	if not is_valid_pin(provided_pin):
+		return jsonify({'error': 'Transaction PIN must be exactly 6 digits'}), 400
+	
+	# Query database for PIN hash
+	try:
+		user_row = await get_user_row(user_id)
+		stored_hash = user_row.get('transaction_pin_hash') if user_row else None
+	except Exception as e:
+		logger.error(f"Failed to verify PIN for user {user_id}: {e}")
+		return jsonify({'error': 'PIN verification failed. Please try again.'}), 500
+	
+	if not stored_hash:
+		return jsonify({'error': 'Transaction PIN not set. Please contact support.'}), 400
+	
+	# Constant-time comparison; scrypt runs in a worker thread so it
+	# doesn't stall the event loop
+	if not await asyncio.to_thread(verify_pin, provided_pin, stored_hash):
+		return jsonify({'error': 'Invalid transaction PIN'}), 403
+	
+	if not is_pin_hashed(stored_hash):
+		from services import run_in_background
+		run_in_background(_upgrade_legacy_pin(user_id, provided_pin))
+	
+	return None
+
+
 def require_pin(f):
 	"""Decorator to require PIN verification for high-value transactions
 	
@@ -123,35 +205,11 @@ def require_pin(f):
 		
 		# Get PIN from request body
 		data = await request.get_json()
-		provided_pin = data.get('pin')
-		
-		if not provided_pin:
-			return jsonify({'error': 'Transaction PIN is required'}), 400
-		
-		if not isinstance(provided_pin, str) or not provided_pin.isdigit() or len(provided_pin) != 6:
-			return jsonify({'error': 'Transaction PIN must be exactly 6 digits'}), 400
+		pin_error = await verify_transaction_pin(user['user_id'], data.get('pin'))
+		if pin_error:
+			return pin_error
 		
-		# Query database for PIN hash
-		from core import get_supabase_client
-		supabase = get_supabase_client()
-		try:
-			user_data = supabase.table('users').select('transaction_pin_hash').eq('id', user['user_id']).single().execute()
-			stored_hash = user_data.data.get('transaction_pin_hash') if user_data.data else None
-			
-			if not stored_hash:
-				return jsonify({'error': 'Transaction PIN not set. Please contact support.'}), 400
-			
-			# Verify PIN - compare plain text
-			pin_valid = provided_pin == stored_hash
-			
-			if not pin_valid:
-				return jsonify({'error': 'Invalid transaction PIN'}), 403
-			
-			# PIN is valid, proceed with the function
-			return await f(user, *args, **kwargs)
-			
-		except Exception as e:
-			logger.error(f"Failed to verify PIN for user {user['user_id']}: {e}")
-			return jsonify({'error': 'PIN verification failed. Please try again.'}), 500
+		# PIN is valid, proceed with the function
+		return await f(user, *args, **kwargs)
 	
 	return decorated_function
@@ -0,0 +1,60 @@
+"""
+Transaction PIN hashing
+PINs are stored as salted scrypt hashes and always compared in constant time
+"""
+import hashlib
+import hmac
+import secrets
+
+# scrypt cost (~50 ms per hash) - verification runs in a worker thread
+_SCRYPT_N = 2 ** 14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SALT_BYTES = 16
+_HASH_PREFIX = 'scrypt$'
+
+
+def _scrypt(pin: str, salt: bytes) -> bytes:
+	return hashlib.scrypt(pin.encode(), salt=salt, n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P)
+
+
+def hash_pin(pin: str) -> str:
+	"""Hash a transaction PIN for storage
+	
+	Args:
+		pin: 6-digit PIN
+	
+	Returns:
+		Encoded hash in the form 'scrypt$<salt hex>$<hash hex>'
+	"""
+	salt = secrets.token_bytes(_SALT_BYTES)
+	return f"{_HASH_PREFIX}{salt.hex()}${_scrypt(pin, salt).hex()}"
+
+
+def is_pin_hashed(stored: str) -> bool:
+	"""Whether a stored PIN value is a hash (False for legacy plain text PINs)"""
+	return stored.startswith(_HASH_PREFIX)
+
+
+def verify_pin(pin: str, stored: str) -> bool:
+	"""Check a PIN against its stored value in constant time
+	
+	Legacy rows that still hold the plain text PIN are compared directly
+	(still constant time); callers should re-store those with hash_pin().
+	
+	Args:
+		pin: PIN supplied by the client
+		stored: Value of users.transaction_pin_hash
+	
+	Returns:
+		True if the PIN matches
+	"""
+	if not is_pin_hashed(stored):
+		return hmac.compare_digest(pin.encode(), stored.encode())
+	
+	try:
+		salt_hex, hash_hex = stored[len(_HASH_PREFIX):].split('$', 1)
+		salt, expected = bytes.fromhex(salt_hex), bytes.fromhex(hash_hex)
+	except ValueError:
+		return False
+	return hmac.compare_digest(_scrypt(pin, salt), expected)
@@ -2,7 +2,8 @@
 Core module for Concierge Bank backend
 """
 from .config import *
-from .database import get_supabase_client
+from .database import get_supabase_client, get_service_client, execute_async
+from . import auth_api
 
 __all__ = [
 	'JWT_SECRET',
@@ -14,5 +15,8 @@ __all__ = [
 	'CARD_EXPIRY_DAYS',
 	'EMAIL_FROM',
 	'LUXURY_GOLD_COLOR',
-	'get_supabase_client'
+	'get_supabase_client',
+	'get_service_client',
+	'execute_async',
+	'auth_api'
 ]
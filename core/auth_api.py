@@ -0,0 +1,128 @@
+"""
+Async Supabase Auth (GoTrue) calls over a shared, pooled HTTP client
+"""
+from typing import Any, Dict, Optional
+import httpx
+from .config import SUPABASE_URL, SUPABASE_KEY, SUPABASE_SERVICE_KEY
+
+# Keep-alive pool reused by every auth call, so per-request flows skip the
+# TCP/TLS handshake a freshly constructed client would need
+AUTH_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+AUTH_HTTP_TIMEOUT = 10.0
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+class AuthAPIError(Exception):
+	"""Error response from Supabase Auth, carrying its message and HTTP status"""
+
+	def __init__(self, message: str, status_code: int):
+		super().__init__(message)
+		self.status_code = status_code
+
+
+def get_http_client() -> httpx.AsyncClient:
+	"""Get or create the shared async HTTP client for Supabase Auth
+
+	Returns:
+		httpx.AsyncClient instance
+	"""
+	global _http_client
+	if _http_client is None or _http_client.is_closed:
+		_http_client = httpx.AsyncClient(
+			base_url=f"{SUPABASE_URL}/auth/v1",
+			headers={'apikey': SUPABASE_KEY},
+			limits=AUTH_HTTP_LIMITS,
+			timeout=AUTH_HTTP_TIMEOUT
+		)
+	return _http_client
+
+
+async def close_http_client() -> None:
+	"""Close the shared HTTP client (call on app shutdown)"""
+	global _http_client
+	if _http_client is not None:
+		await _http_client.aclose()
+		_http_client = None
+
+
+async def _auth_request(method: str, path: str, **kwargs: Any) -> httpx.Response:
+	"""Send a request to Supabase Auth, retrying once on a dropped keep-alive connection"""
+	client = get_http_client()
+	try:
+		return await client.request(method, path, **kwargs)
+	except httpx.RemoteProtocolError:
+		return await client.request(method, path, **kwargs)
+
+
+def _json_or_raise(response: httpx.Response) -> Dict[str, Any]:
+	"""Return the response JSON, or raise AuthAPIError with Supabase Auth's message"""
+	if response.is_error:
+		try:
+			body = response.json()
+		except ValueError:
+			body = {}
+		message = body.get('msg') or body.get('error_description') or body.get('message') or response.reason_phrase
+		raise AuthAPIError(message, response.status_code)
+	return response.json()
+
+
+async def sign_up(email: str, password: str) -> Dict[str, Any]:
+	"""Create a Supabase Auth user
+
+	Args:
+		email: User's email address
+		password: User's password
+
+	Returns:
+		Created auth user dict
+	"""
+	response = await _auth_request('POST', '/signup', json={'email': email, 'password': password})
+	data = _json_or_raise(response)
+	# With auto-confirm on, Supabase returns a session wrapping the user
+	return data.get('user') or data
+
+
+async def sign_in_with_password(email: str, password: str) -> Optional[Dict[str, Any]]:
+	"""Sign in with email and password
+
+	Args:
+		email: User's email address
+		password: User's password
+
+	Returns:
+		Session dict (access_token, user, ...) or None if the credentials are invalid
+	"""
+	response = await _auth_request(
+		'POST',
+		'/token',
+		params={'grant_type': 'password'},
+		json={'email': email, 'password': password}
+	)
+	if response.status_code in (400, 401):
+		return None
+	return _json_or_raise(response)
+
+
+async def admin_update_user(user_id: str, attributes: Dict[str, Any]) -> Dict[str, Any]:
+	"""Update any user's auth attributes with the service-role key
+
+	Args:
+		user_id: Auth user's unique identifier
+		attributes: Attributes to update (e.g. {'password': ...})
+
+	Returns:
+		Updated auth user dict
+
+	Raises:
+		AuthAPIError: If SUPABASE_SERVICE_KEY is not configured or the update fails
+	"""
+	if not SUPABASE_SERVICE_KEY:
+		raise AuthAPIError('SUPABASE_SERVICE_KEY is not configured', 500)
+	response = await _auth_request(
+		'PUT',
+		f'/admin/users/{user_id}',
+		headers={'apikey': SUPABASE_SERVICE_KEY, 'Authorization': f'Bearer {SUPABASE_SERVICE_KEY}'},
+		json=attributes
+	)
+	return _json_or_raise(response)
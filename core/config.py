@@ -25,6 +25,7 @@ LUXURY_GOLD_COLOR = '#B8860B'
 # Supabase Configuration
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_KEY = os.getenv('SUPABASE_KEY')
+SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_KEY')  # Required for Auth admin calls
 
 # Resend Configuration
 RESEND_API_KEY = os.getenv('RESEND_API_KEY')
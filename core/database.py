@@ -1,10 +1,13 @@
 """
 Database client initialization
 """
+import asyncio
+from typing import Any
 from supabase import create_client, Client
-from .config import SUPABASE_URL, SUPABASE_KEY
+from .config import SUPABASE_URL, SUPABASE_KEY, SUPABASE_SERVICE_KEY
 
 _supabase_client: Client = None
+_service_client: Client = None
 
 
 def get_supabase_client() -> Client:
@@ -17,3 +20,37 @@ def get_supabase_client() -> Client:
 	if _supabase_client is None:
 		_supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
 	return _supabase_client
+
+
+def get_service_client() -> Client:
+	"""Get or create the Supabase client authenticated with the service-role key
+	
+	Used for the stored procedures whose EXECUTE is granted only to
+	service_role (e.g. execute_transfer), so they can't be called directly
+	with the public anon key.
+	
+	Returns:
+		Supabase client instance
+	"""
+	global _service_client
+	if _service_client is None:
+		if not SUPABASE_SERVICE_KEY:
+			raise RuntimeError('SUPABASE_SERVICE_KEY is not configured')
+		_service_client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+	return _service_client
+
+
+async def execute_async(query: Any) -> Any:
+	"""Execute a supabase-py query in a worker thread
+	
+	supabase-py's client is synchronous, so calling .execute() directly blocks
+	the event loop. Running it in a thread lets independent queries overlap
+	(e.g. with asyncio.gather).
+	
+	Args:
+		query: Supabase query builder (anything with an .execute() method)
+	
+	Returns:
+		The query's API response
+	"""
+	return await asyncio.to_thread(query.execute)
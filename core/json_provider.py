@@ -0,0 +1,25 @@
+"""
+orjson-backed JSON provider for Quart responses
+"""
+from typing import Any
+import orjson
+from quart.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+	"""JSON provider that serializes with orjson instead of the stdlib json module
+
+	Used by jsonify() for every blueprint. Types orjson does not know natively
+	(e.g. Decimal) fall back to Quart's default encoder.
+	"""
+
+	def dumps(self, object_: Any, **kwargs: Any) -> str:
+		option = orjson.OPT_NON_STR_KEYS
+		if kwargs.get('sort_keys', self.sort_keys):
+			option |= orjson.OPT_SORT_KEYS
+		if kwargs.get('indent'):
+			option |= orjson.OPT_INDENT_2
+		return orjson.dumps(object_, default=self.default, option=option).decode()
+
+	def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+		return orjson.loads(s)
@@ -0,0 +1,37 @@
+-- Migration: Add broadcast_admin_notification function
+-- Description: Fan out one notification row per admin in a single server-side
+-- INSERT ... SELECT instead of one PostgREST insert per admin
+
+-- The return type gained notification_preferences, which CREATE OR REPLACE
+-- can't change in place
+DROP FUNCTION IF EXISTS public.broadcast_admin_notification(TEXT, TEXT, TEXT);
+
+CREATE OR REPLACE FUNCTION public.broadcast_admin_notification(
+    ntype TEXT,
+    message TEXT,
+    delivery_method TEXT DEFAULT 'email'
+)
+RETURNS TABLE (user_id UUID, email TEXT, notification_preferences JSONB)
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    WITH inserted AS (
+        INSERT INTO notifications (user_id, type, message, delivery_method, created_at)
+        SELECT u.id, ntype, message, delivery_method, NOW()
+        FROM users u
+        WHERE u.role = 'admin'
+        RETURNING notifications.user_id
+    )
+    SELECT i.user_id, u.email, u.notification_preferences
+    FROM inserted i
+    JOIN users u ON u.id = i.user_id;
+$$;
+
+COMMENT ON FUNCTION public.broadcast_admin_notification(TEXT, TEXT, TEXT) IS
+'Inserts a notification for every admin user and returns their ids, emails and notification preferences so the caller can send alert emails.';
+
+-- SECURITY DEFINER bypasses RLS on notifications, so only the backend may
+-- call it (through get_service_client() with SUPABASE_SERVICE_KEY)
+REVOKE EXECUTE ON FUNCTION public.broadcast_admin_notification(TEXT, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.broadcast_admin_notification(TEXT, TEXT, TEXT) TO service_role;
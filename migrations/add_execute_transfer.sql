@@ -0,0 +1,71 @@
+-- Migration: Add execute_transfer function
+-- Description: Perform every write of a transfer (debit, debit transaction,
+-- optional credit and credit transaction, transfer record) in one database
+-- transaction instead of up to six separate PostgREST requests. The debit
+-- checks the balance in the same UPDATE, so concurrent transfers can't
+-- overdraw the source account.
+--
+-- Errors carry dedicated SQLSTATEs so callers can map them without parsing
+-- the message: CB001 = insufficient funds, CB002 = destination account missing.
+
+CREATE OR REPLACE FUNCTION public.execute_transfer(
+    p_user UUID,
+    p_from UUID,
+    p_to UUID,
+    p_amount NUMERIC,
+    p_type TEXT,
+    p_external JSONB,
+    p_status TEXT,
+    p_debit_description TEXT,
+    p_credit_description TEXT DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_from_balance NUMERIC;
+    v_transfer transfers;
+BEGIN
+    -- Debit source account (must belong to the user and cover the amount)
+    UPDATE accounts
+    SET balance = balance - p_amount, updated_at = NOW()
+    WHERE id = p_from AND user_id = p_user AND balance >= p_amount
+    RETURNING balance INTO v_from_balance;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION USING ERRCODE = 'CB001', MESSAGE = 'insufficient_funds';
+    END IF;
+
+    INSERT INTO transactions (account_id, type, amount, description, category, created_at)
+    VALUES (p_from, 'debit', p_amount, p_debit_description, 'transfer', NOW());
+
+    -- Credit destination (internal transfers, P2P to a registered user)
+    IF p_to IS NOT NULL AND p_credit_description IS NOT NULL THEN
+        UPDATE accounts
+        SET balance = balance + p_amount, updated_at = NOW()
+        WHERE id = p_to;
+
+        IF NOT FOUND THEN
+            RAISE EXCEPTION USING ERRCODE = 'CB002', MESSAGE = 'destination_account_not_found';
+        END IF;
+
+        INSERT INTO transactions (account_id, type, amount, description, category, created_at)
+        VALUES (p_to, 'credit', p_amount, p_credit_description, 'transfer', NOW());
+    END IF;
+
+    INSERT INTO transfers (user_id, from_account_id, to_account_id, to_external, amount, transfer_type, status, created_at)
+    VALUES (p_user, p_from, p_to, COALESCE(p_external, '{}'::jsonb), p_amount, p_type, p_status, NOW())
+    RETURNING * INTO v_transfer;
+
+    RETURN jsonb_build_object('transfer', to_jsonb(v_transfer), 'from_balance', v_from_balance);
+END;
+$$;
+
+COMMENT ON FUNCTION public.execute_transfer(UUID, UUID, UUID, NUMERIC, TEXT, JSONB, TEXT, TEXT, TEXT) IS
+'Atomically debits the source account, credits the destination (if any), records both transactions and the transfer. Raises CB001 if the balance does not cover the amount and CB002 if the destination account does not exist.';
+
+-- The function trusts p_user, so only the backend (which calls it through
+-- get_service_client() with SUPABASE_SERVICE_KEY) may execute it
+REVOKE EXECUTE ON FUNCTION public.execute_transfer(UUID, UUID, UUID, NUMERIC, TEXT, JSONB, TEXT, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.execute_transfer(UUID, UUID, UUID, NUMERIC, TEXT, JSONB, TEXT, TEXT, TEXT) TO service_role;
@@ -0,0 +1,53 @@
+-- Migration: Add get_user_transfers function
+-- Description: Return a user's sent transfers plus the P2P transfers addressed
+-- to their email or phone in one query, instead of pulling every P2P transfer
+-- in the system and matching recipients in Python.
+
+-- Recipient lookups for P2P transfers (matches the expressions used below)
+CREATE INDEX IF NOT EXISTS idx_transfers_p2p_email
+    ON transfers (lower(to_external->>'email')) WHERE transfer_type = 'p2p';
+CREATE INDEX IF NOT EXISTS idx_transfers_p2p_phone
+    ON transfers (btrim(to_external->>'phone')) WHERE transfer_type = 'p2p';
+
+DROP FUNCTION IF EXISTS public.get_user_transfers(UUID, INT);
+
+CREATE OR REPLACE FUNCTION public.get_user_transfers(
+    uid UUID,
+    max_rows INT DEFAULT 100,
+    skip_rows INT DEFAULT 0
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    WITH me AS (
+        SELECT NULLIF(lower(email), '') AS email, NULLIF(phone, '') AS phone
+        FROM users
+        WHERE id = uid
+    ),
+    user_transfers AS (
+        SELECT to_jsonb(t) AS transfer, t.created_at
+        FROM transfers t
+        WHERE t.user_id = uid
+        UNION ALL
+        -- P2P transfers sent to this user, marked for display
+        SELECT to_jsonb(t) || '{"direction": "received"}'::jsonb, t.created_at
+        FROM transfers t, me
+        WHERE t.transfer_type = 'p2p'
+          AND t.user_id IS DISTINCT FROM uid
+          AND (lower(t.to_external->>'email') = me.email
+               OR btrim(t.to_external->>'phone') = me.phone)
+    )
+    SELECT COALESCE(jsonb_agg(transfer ORDER BY created_at DESC), '[]'::jsonb)
+    FROM (
+        SELECT transfer, created_at
+        FROM user_transfers
+        ORDER BY created_at DESC
+        LIMIT max_rows
+        OFFSET skip_rows
+    ) recent;
+$$;
+
+COMMENT ON FUNCTION public.get_user_transfers(UUID, INT, INT) IS
+'Returns a page of the transfers sent by a user and P2P transfers addressed to their email or phone, newest first.';
@@ -0,0 +1,96 @@
+-- Migration: Add global_search function
+-- Description: Run all six global search lookups (accounts, transactions,
+-- cards, bills, beneficiaries, notifications) in one RPC instead of one
+-- PostgREST request per entity. Pairs with add_search_trgm_indexes.sql.
+-- Amounts match as text, like the other columns, so "500" finds 1500.25.
+
+-- An earlier version took an exact-match q_amount parameter
+DROP FUNCTION IF EXISTS public.global_search(UUID, TEXT, NUMERIC, INT, INT, INT);
+
+CREATE OR REPLACE FUNCTION public.global_search(
+    uid UUID,
+    q TEXT,
+    entity_limit INT DEFAULT 50,
+    transaction_limit INT DEFAULT 10,
+    notification_limit INT DEFAULT 5
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SET search_path = public
+AS $$
+DECLARE
+    -- Substring pattern with LIKE wildcards in the query escaped
+    pattern TEXT := '%' || replace(replace(replace(q, '\', '\\'), '%', '\%'), '_', '\_') || '%';
+BEGIN
+    RETURN jsonb_build_object(
+        'accounts', COALESCE((
+            SELECT jsonb_agg(a)
+            FROM (
+                SELECT id, account_number, account_type, balance, status
+                FROM accounts
+                WHERE user_id = uid
+                  AND (account_number ILIKE pattern OR account_type ILIKE pattern OR balance::text ILIKE pattern)
+                LIMIT entity_limit
+            ) a
+        ), '[]'::jsonb),
+        'transactions', COALESCE((
+            SELECT jsonb_agg(t ORDER BY t.created_at DESC)
+            FROM (
+                SELECT tx.id, tx.account_id, tx.amount, tx.type, tx.description, tx.merchant, tx.category, tx.created_at
+                FROM transactions tx
+                JOIN accounts acc ON acc.id = tx.account_id
+                WHERE acc.user_id = uid
+                  AND (tx.description ILIKE pattern OR tx.merchant ILIKE pattern OR tx.category ILIKE pattern
+                       OR tx.type ILIKE pattern OR tx.amount::text ILIKE pattern)
+                ORDER BY tx.created_at DESC
+                LIMIT transaction_limit
+            ) t
+        ), '[]'::jsonb),
+        'cards', COALESCE((
+            SELECT jsonb_agg(c)
+            FROM (
+                SELECT id, card_number, card_type, card_brand, balance, status
+                FROM cards
+                WHERE user_id = uid
+                  AND (card_number ILIKE pattern OR card_brand ILIKE pattern OR card_type ILIKE pattern)
+                LIMIT entity_limit
+            ) c
+        ), '[]'::jsonb),
+        'bills', COALESCE((
+            SELECT jsonb_agg(b)
+            FROM (
+                SELECT id, payee_name, bill_type, amount, due_date, auto_pay
+                FROM bills
+                WHERE user_id = uid
+                  AND (payee_name ILIKE pattern OR bill_type ILIKE pattern OR amount::text ILIKE pattern)
+                LIMIT entity_limit
+            ) b
+        ), '[]'::jsonb),
+        'beneficiaries', COALESCE((
+            SELECT jsonb_agg(be)
+            FROM (
+                SELECT id, full_name, relationship, percentage
+                FROM beneficiaries
+                WHERE user_id = uid
+                  AND (full_name ILIKE pattern OR relationship ILIKE pattern OR email ILIKE pattern)
+                LIMIT entity_limit
+            ) be
+        ), '[]'::jsonb),
+        'notifications', COALESCE((
+            SELECT jsonb_agg(n ORDER BY n.created_at DESC)
+            FROM (
+                SELECT id, type, title, message, read, created_at
+                FROM notifications
+                WHERE user_id = uid
+                  AND (message ILIKE pattern OR type ILIKE pattern OR title ILIKE pattern)
+                ORDER BY created_at DESC
+                LIMIT notification_limit
+            ) n
+        ), '[]'::jsonb)
+    );
+END;
+$$;
+
+COMMENT ON FUNCTION public.global_search(UUID, TEXT, INT, INT, INT) IS
+'Returns the rows matching q for each global search entity of one user as a JSONB object keyed by entity.';
@@ -0,0 +1,19 @@
+-- Migration: Add composite indexes for ownership checks and transfer history
+-- Description: verify_account_ownership filters accounts by (id, user_id) and
+-- get_user_transfers reads a user's transfers newest first. Composite indexes
+-- let Postgres answer the ownership check and the ordered, paginated history
+-- from the index instead of filtering/sorting the matched rows.
+-- P2P recipient indexes live in add_get_user_transfers.sql.
+-- On a busy production database, run each CREATE INDEX with CONCURRENTLY
+-- (outside a transaction) to avoid blocking writes while it builds.
+
+CREATE INDEX IF NOT EXISTS idx_accounts_id_user_id ON accounts(id, user_id);
+
+-- Superset of idx_transfers_user_id, which becomes redundant
+CREATE INDEX IF NOT EXISTS idx_transfers_user_id_created_at ON transfers(user_id, created_at DESC);
+DROP INDEX IF EXISTS idx_transfers_user_id;
+
+-- Admin card issue reports page on (created_at, id); superset of
+-- idx_card_issue_reports_created_at, which becomes redundant
+CREATE INDEX IF NOT EXISTS idx_card_issue_reports_created_at_id ON card_issue_reports(created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_card_issue_reports_created_at;
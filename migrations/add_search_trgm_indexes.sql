@@ -0,0 +1,16 @@
+-- Migration: Add trigram indexes for global search
+-- Description: Global search now filters with ILIKE '%q%' server-side.
+-- pg_trgm GIN indexes let Postgres serve those substring matches from an index
+-- on the high-volume tables. Accounts, cards, bills and beneficiaries are small
+-- per user and are already narrowed by their user_id indexes.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Transactions: description, merchant, category
+CREATE INDEX IF NOT EXISTS idx_transactions_description_trgm ON transactions USING gin (description gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_transactions_merchant_trgm ON transactions USING gin (merchant gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_transactions_category_trgm ON transactions USING gin (category gin_trgm_ops);
+
+-- Notifications: message, title
+CREATE INDEX IF NOT EXISTS idx_notifications_message_trgm ON notifications USING gin (message gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_notifications_title_trgm ON notifications USING gin (title gin_trgm_ops);
@@ -0,0 +1,8 @@
+-- Migration: Store transaction PINs hashed
+-- Description: transaction_pin_hash now holds a salted scrypt hash
+-- ('scrypt$<salt hex>$<hash hex>') written by the backend. Existing plain
+-- text PINs keep working and are replaced with a hash the next time the user
+-- enters their PIN correctly, so no data rewrite is needed here.
+
+COMMENT ON COLUMN public.users.transaction_pin_hash IS
+'Salted scrypt hash of the 6-digit PIN required for finalizing financial transactions (legacy rows may hold plain text until next use). Users can only change this PIN by contacting bank support.';
@@ -2,7 +2,7 @@
 Accounts routes for Concierge Bank
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from quart import Blueprint, request, jsonify
 
 from core import get_supabase_client
@@ -47,7 +47,7 @@ async def create_account(user):
 		'currency': 'USD',
 		'status': 'active',
 		'routing_number': '121000248',  # Wells Fargo routing number
-		'created_at': datetime.utcnow().isoformat()
+		'created_at': datetime.now(timezone.utc).isoformat()
 	}
 	
 	result = supabase.table('accounts').insert(account_data).execute()
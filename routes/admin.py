@@ -1,14 +1,15 @@
 """
 Admin routes for Concierge Bank - Superuser operations
 """
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from quart import Blueprint, request, jsonify
 
 from core import get_supabase_client
-from auth import require_auth
-from utils import verify_account_ownership, update_account_balance, insert_record
-from services import notify_user
+from auth import require_auth, hash_pin
+from utils import verify_account_ownership, update_account_balance, insert_record, is_valid_pin
+from services import notify_user, invalidate_admin_ids, invalidate_user_profile
 from templates import bill_payment_email
 
 logger = logging.getLogger(__name__)
@@ -49,15 +50,18 @@ async def update_user(user, user_id):
     allowed_fields = ['full_name', 'phone', 'address', 'preferred_brand', 'role', 'account_status', 'transactions_blocked', 'transaction_pin_hash']
     update_data = {k: v for k, v in data.items() if k in allowed_fields}
     
-    # Handle PIN update - store plain PIN
+    # Handle PIN update - admins send the new PIN, which is stored hashed
     if 'transaction_pin_hash' in update_data:
         pin = update_data['transaction_pin_hash']
-        if pin and isinstance(pin, str) and pin.isdigit() and len(pin) == 6:
-            update_data['transaction_pin_hash'] = pin
+        if is_valid_pin(pin):
+            update_data['transaction_pin_hash'] = await asyncio.to_thread(hash_pin, pin)
         else:
             return jsonify({'error': 'Transaction PIN must be exactly 6 digits'}), 400
 
     result = supabase.table('users').update(update_data).eq('id', user_id).execute()
+    invalidate_user_profile(user_id)
+    if 'role' in update_data:
+        invalidate_admin_ids()
     logger.info(f"User {user_id} updated by admin {user['user_id']}")
     return jsonify(result.data[0])
 
@@ -87,7 +91,7 @@ async def update_account_balance_admin(user, account_id):
 
     result = supabase.table('accounts').update({
         'balance': new_balance,
-        'updated_at': datetime.utcnow().isoformat()
+        'updated_at': datetime.now(timezone.utc).isoformat()
     }).eq('id', account_id).execute()
 
     logger.info(f"Account {account_id} balance updated to {new_balance} by admin {user['user_id']}")
@@ -117,7 +121,7 @@ async def create_bill_for_user(user):
         'amount': float(data['amount']),
         'due_date': data['due_date'],
         'auto_pay': data.get('auto_pay', False),
-        'created_at': datetime.utcnow().isoformat()
+        'created_at': datetime.now(timezone.utc).isoformat()
     }
 
     result = supabase.table('bills').insert(bill_data).execute()
@@ -162,7 +166,7 @@ async def send_notification_to_user(user):
         'message': message,
         'delivery_method': 'push',
         'read': False,
-        'created_at': datetime.utcnow().isoformat()
+        'created_at': datetime.now(timezone.utc).isoformat()
     }
 
     result = supabase.table('notifications').insert(notification_data).execute()
@@ -246,8 +250,9 @@ async def block_user(user, user_id):
 
     result = supabase.table('users').update({
         'account_status': 'blocked',
-        'updated_at': datetime.utcnow().isoformat()
+        'updated_at': datetime.now(timezone.utc).isoformat()
     }).eq('id', user_id).execute()
+    invalidate_user_profile(user_id)
 
     logger.info(f"User {user_id} blocked by admin {user['user_id']}")
     return jsonify(result.data[0])
@@ -263,8 +268,9 @@ async def unblock_user(user, user_id):
 
     result = supabase.table('users').update({
         'account_status': 'active',
-        'updated_at': datetime.utcnow().isoformat()
+        'updated_at': datetime.now(timezone.utc).isoformat()
     }).eq('id', user_id).execute()
+    invalidate_user_profile(user_id)
 
     logger.info(f"User {user_id} unblocked by admin {user['user_id']}")
     return jsonify(result.data[0])
@@ -284,8 +290,9 @@ async def block_user_transactions(user, user_id):
 
     result = supabase.table('users').update({
         'transactions_blocked': True,
-        'updated_at': datetime.utcnow().isoformat()
+        'updated_at': datetime.now(timezone.utc).isoformat()
     }).eq('id', user_id).execute()
+    invalidate_user_profile(user_id)
 
     logger.info(f"User {user_id} transactions blocked by admin {user['user_id']}")
     return jsonify(result.data[0])
@@ -301,8 +308,9 @@ async def unblock_user_transactions(user, user_id):
 
     result = supabase.table('users').update({
         'transactions_blocked': False,
-        'updated_at': datetime.utcnow().isoformat()
+        'updated_at': datetime.now(timezone.utc).isoformat()
     }).eq('id', user_id).execute()
+    invalidate_user_profile(user_id)
 
     logger.info(f"User {user_id} transactions unblocked by admin {user['user_id']}")
     return jsonify(result.data[0])
@@ -1,16 +1,17 @@
 """
 Authentication routes for Concierge Bank
 """
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from quart import Blueprint, request, jsonify
 
-from core import get_supabase_client
-from core.config import JWT_EXPIRATION_HOURS, SUPABASE_URL, SUPABASE_KEY
-from auth import create_jwt_token, require_auth
-from supabase import create_client, Client
+from core import get_supabase_client, execute_async, auth_api
+from core.config import JWT_EXPIRATION_HOURS
+from auth import create_jwt_token, require_auth, hash_pin
 from utils.bot_prevention import validate_bot_prevention
-from services import notify_user
+from utils.validators import is_valid_pin
+from services import notify_user, invalidate_user_profile
 from templates import welcome_email
 
 logger = logging.getLogger(__name__)
@@ -59,7 +60,7 @@ async def register():
         
         # Validate PIN
         pin = data['transaction_pin']
-        if not isinstance(pin, str) or not pin.isdigit() or len(pin) != 6:
+        if not is_valid_pin(pin):
             return jsonify({'error': 'Transaction PIN must be exactly 6 digits'}), 400
         
         # Simple bot prevention (rate limiting + honeypot)
@@ -70,19 +71,16 @@ async def register():
             return jsonify({'error': error_msg}), 429
         logger.info(f"Bot prevention passed for registration from IP {client_ip}")
         
-        # Get Supabase client
-        supabase_client: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-        auth_response = supabase_client.auth.sign_up({
-            'email': data['email'],
-            'password': data['password']
-        })
+        # Create the auth user over the shared, pooled auth HTTP client
+        auth_user = await auth_api.sign_up(data['email'], data['password'])
+        user_id = auth_user.get('id')
         
-        if not auth_response.user:
+        if not user_id:
             return jsonify({'error': 'Registration failed'}), 400
         
         # Create user profile in users table
         profile_data = {
-            'id': auth_response.user.id,
+            'id': user_id,
             'email': data['email'],
             'full_name': data.get('full_name', ''),
             'phone': data.get('phone', ''),
@@ -90,17 +88,17 @@ async def register():
             'preferred_brand': data.get('preferred_brand', 'Cartier'),
             'role': 'user',  # Default role
             'account_status': 'active',  # Default status
-            'transaction_pin_hash': pin,
-            'created_at': datetime.utcnow().isoformat()
+            'transaction_pin_hash': await asyncio.to_thread(hash_pin, pin),
+            'created_at': datetime.now(timezone.utc).isoformat()
         }
         
-        supabase_client.table('users').insert(profile_data).execute()
+        await execute_async(supabase.table('users').insert(profile_data))
         
         # Send welcome notification
         html = welcome_email(data.get('full_name', ''))
         await notify_user(
-            supabase_client,
-            auth_response.user.id,
+            supabase,
+            user_id,
             'registration',
             'Welcome email sent',
             'Welcome to Concierge Bank',
@@ -109,7 +107,7 @@ async def register():
         
         # Create JWT token with role, status, and transaction blocking status
         token = create_jwt_token(
-            auth_response.user.id, 
+            user_id, 
             data['email'],
             role='user',
             account_status='active',
@@ -121,7 +119,7 @@ async def register():
             'message': 'Registration successful',
             'token': token,
             'user': {
-                'id': auth_response.user.id,
+                'id': user_id,
                 'email': data['email'],
                 'full_name': data.get('full_name', '')
             }
@@ -145,18 +143,15 @@ async def login():
             logger.warning(f"Bot login attempt blocked from IP {client_ip}: {error_msg}")
             return jsonify({'error': error_msg}), 429
         
-        # Authenticate with Supabase
-        supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
-        auth_response = supabase_client.auth.sign_in_with_password({
-            'email': data['email'],
-            'password': data['password']
-        })
+        # Authenticate with Supabase over the shared, pooled auth HTTP client
+        session = await auth_api.sign_in_with_password(data['email'], data['password'])
         
-        if not auth_response.user:
+        if not session or not session.get('user'):
             return jsonify({'error': 'Invalid credentials'}), 401
+        user_id = session['user']['id']
         
         # Get user profile from users table
-        user_data = supabase_client.table('users').select('*').eq('id', auth_response.user.id).single().execute()
+        user_data = await execute_async(supabase.table('users').select('*').eq('id', user_id).single())
         
         # Check if account is blocked or suspended
         account_status = user_data.data.get('account_status', 'active')
@@ -169,7 +164,7 @@ async def login():
         
         # Create JWT token with role, account status, and transaction blocking status
         token = create_jwt_token(
-            auth_response.user.id,
+            user_id,
             data['email'],
             role=user_data.data.get('role', 'user'),
             account_status=account_status,
@@ -212,7 +207,7 @@ async def get_me(user):
                 'full_name': '',
                 'role': 'user',
                 'account_status': user.get('account_status', 'active'),
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': datetime.now(timezone.utc).isoformat()
             }
             result = supabase.table('users').insert(profile_data).execute()
             return jsonify(result.data[0])
@@ -224,6 +219,7 @@ async def get_me(user):
             user_profile['role'] = 'user'
             # Update database to fix missing role
             supabase.table('users').update({'role': 'user'}).eq('id', user['user_id']).execute()
+            invalidate_user_profile(user['user_id'])
         
         logger.debug(f"User profile fetched for {user['user_id']}: role={user_profile.get('role')}, status={user_profile.get('account_status')}")
         return jsonify(user_profile)
@@ -244,14 +240,15 @@ async def set_transaction_pin(user):
             return jsonify({'error': 'Transaction PIN is required'}), 400
         
         # Validate PIN format
-        if not isinstance(new_pin, str) or not new_pin.isdigit() or len(new_pin) != 6:
+        if not is_valid_pin(new_pin):
             return jsonify({'error': 'Transaction PIN must be exactly 6 digits'}), 400
         
-        # Update PIN in database (stored as plain text for this implementation)
+        # Update PIN in database (stored as a salted scrypt hash)
         supabase.table('users').update({
-            'transaction_pin_hash': new_pin,
-            'updated_at': datetime.utcnow().isoformat()
+            'transaction_pin_hash': await asyncio.to_thread(hash_pin, new_pin),
+            'updated_at': datetime.now(timezone.utc).isoformat()
         }).eq('id', user['user_id']).execute()
+        invalidate_user_profile(user['user_id'])
         
         logger.info(f"Transaction PIN set/updated for user {user['user_id']}")
         return jsonify({'message': 'Transaction PIN set successfully'}), 200
@@ -2,11 +2,11 @@
 Bills routes for Concierge Bank
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from quart import Blueprint, request, jsonify
 
 from core import get_supabase_client
-from auth import require_auth, require_transactions_enabled
+from auth import require_auth, require_transactions_enabled, verify_transaction_pin, get_user_row
 from utils import verify_account_ownership, check_sufficient_balance, update_account_balance, insert_record, create_transaction_record
 from services import notify_user
 from templates import bill_payment_email
@@ -57,7 +57,7 @@ async def add_bill(user):
 		'amount': amount,
 		'due_date': data['due_date'],
 		'auto_pay': data.get('auto_pay', False),
-		'created_at': datetime.utcnow().isoformat()
+		'created_at': datetime.now(timezone.utc).isoformat()
 	}
 	
 	result = supabase.table('bills').insert(bill_data).execute()
@@ -73,27 +73,15 @@ async def pay_bill(user, bill_id):
 	data = await request.get_json()
 	
 	# Verify PIN first
-	provided_pin = data.get('pin')
-	if not provided_pin:
-		return jsonify({'error': 'Transaction PIN is required'}), 400
+	pin_error = await verify_transaction_pin(user['user_id'], data.get('pin'))
+	if pin_error:
+		return pin_error
 	
-	if not isinstance(provided_pin, str) or not provided_pin.isdigit() or len(provided_pin) != 6:
-		return jsonify({'error': 'Transaction PIN must be exactly 6 digits'}), 400
-	
-	# Verify PIN against database
+	# Parse amount once and reuse it for validation, records and notification
 	try:
-		user_data = supabase.table('users').select('transaction_pin_hash').eq('id', user['user_id']).single().execute()
-		stored_hash = user_data.data.get('transaction_pin_hash') if user_data.data else None
-		
-		if not stored_hash:
-			return jsonify({'error': 'Transaction PIN not set. Please contact support.'}), 400
-		
-		# Verify PIN - compare plain text
-		if provided_pin != stored_hash:
-			return jsonify({'error': 'Invalid transaction PIN'}), 403
-	except Exception as e:
-		logger.error(f"Failed to verify PIN for user {user['user_id']}: {e}")
-		return jsonify({'error': 'PIN verification failed. Please try again.'}), 500
+		amount = float(data['amount'])
+	except (KeyError, ValueError, TypeError):
+		return jsonify({'error': 'Invalid amount format'}), 400
 	
 	# Verify bill ownership
 	bill = supabase.table('bills').select('*').eq('id', bill_id).eq('user_id', user['user_id']).single().execute()
@@ -105,25 +93,27 @@ async def pay_bill(user, bill_id):
 	if not success:
 		return jsonify({'error': error}), 400
 	
-	has_balance, balance_error = await check_sufficient_balance(account_data, float(data['amount']))
+	has_balance, balance_error = await check_sufficient_balance(account_data, amount)
 	if not has_balance:
 		return jsonify({'error': balance_error}), 400
 	
 	# Create payment record
+	now = datetime.now(timezone.utc)
+	payment_date = data.get('payment_date', now.isoformat())
 	payment_data = {
 		'user_id': user['user_id'],
 		'bill_id': bill_id,
 		'account_id': data['account_id'],
-		'amount': float(data['amount']),
-		'payment_date': data.get('payment_date', datetime.utcnow().isoformat()),
+		'amount': amount,
+		'payment_date': payment_date,
 		'status': 'completed',
-		'created_at': datetime.utcnow().isoformat()
+		'created_at': now.isoformat()
 	}
 	
 	result = supabase.table('bill_payments').insert(payment_data).execute()
 	
 	# Update account balance
-	new_balance = account_data['balance'] - float(data['amount'])
+	new_balance = account_data['balance'] - amount
 	await update_account_balance(supabase, data['account_id'], new_balance)
 	
 	# Create transaction record for bill payment
@@ -131,7 +121,7 @@ async def pay_bill(user, bill_id):
 		supabase,
 		data['account_id'],
 		'debit',
-		float(data['amount']),
+		amount,
 		f"Bill payment to {bill.data['payee_name']}",
 		'bill_payment'
 	)
@@ -139,16 +129,20 @@ async def pay_bill(user, bill_id):
 	# Send notification
 	html = bill_payment_email(
 		bill.data['payee_name'],
-		float(data['amount']),
-		data.get('payment_date', datetime.utcnow().strftime('%Y-%m-%d'))
+		amount,
+		data.get('payment_date', now.strftime('%Y-%m-%d'))
 	)
+	# Already loaded by the transactions-enabled and PIN checks
+	user_row = await get_user_row(user['user_id'])
 	await notify_user(
 		supabase,
 		user['user_id'],
 		'bill_payment',
 		f'Payment to {bill.data["payee_name"]} completed',
 		'Bill Payment Confirmation',
-		html
+		html,
+		prefs=user_row.get('notification_preferences') or {},
+		email=user_row.get('email')
 	)
 	
 	logger.info(f"Bill payment completed for user {user['user_id']}: {bill.data['payee_name']}")
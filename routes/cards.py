@@ -2,20 +2,24 @@
 Cards routes for Concierge Bank
 """
 import logging
-from datetime import datetime, timedelta
+import uuid
+from datetime import datetime, timedelta, timezone
 from quart import Blueprint, request, jsonify
 
-from core import get_supabase_client
+from core import get_supabase_client, get_service_client
 from core.config import CARD_EXPIRY_DAYS
 from auth import require_auth
 from utils import generate_card_number, generate_cvv
-from services import notify_user
+from services import notify_user, notify_admins
 from templates import card_approved_email
 
 logger = logging.getLogger(__name__)
 cards_bp = Blueprint('cards', __name__, url_prefix='/api/cards')
 supabase = get_supabase_client()
 
+ISSUE_REPORTS_PAGE_SIZE = 50
+ISSUE_REPORTS_MAX_PAGE_SIZE = 200
+
 
 @cards_bp.route('', methods=['GET'])
 @require_auth
@@ -56,6 +60,7 @@ async def apply_card(user):
 	
 	card_number = generate_card_number()
 	cvv = generate_cvv()
+	now = datetime.now(timezone.utc)
 	
 	card_data = {
 		'user_id': user['user_id'],
@@ -63,11 +68,11 @@ async def apply_card(user):
 		'card_type': data['card_type'],
 		'card_brand': data.get('card_brand', 'Cartier'),
 		'cvv': cvv,
-		'expiry_date': (datetime.utcnow() + timedelta(days=CARD_EXPIRY_DAYS)).strftime('%m/%y'),
+		'expiry_date': (now + timedelta(days=CARD_EXPIRY_DAYS)).strftime('%m/%y'),
 		'credit_limit': credit_limit,
 		'balance': 0,
 		'status': 'active',
-		'created_at': datetime.utcnow().isoformat()
+		'created_at': now.isoformat()
 	}
 	
 	result = supabase.table('cards').insert(card_data).execute()
@@ -77,7 +82,7 @@ async def apply_card(user):
 		data.get('card_brand', 'Cartier'),
 		data['card_type'],
 		card_number[-4:],
-		float(data.get('credit_limit', 10000))
+		credit_limit
 	)
 	await notify_user(
 		supabase,
@@ -99,10 +104,14 @@ async def lock_card(user, card_id):
 	data = await request.get_json()
 	locked = data.get('locked', True)
 	
+	# Ownership check and update in one round-trip - PostgREST returns the updated row
 	result = supabase.table('cards').update({
 		'status': 'locked' if locked else 'active'
 	}).eq('id', card_id).eq('user_id', user['user_id']).execute()
 	
+	if not result.data:
+		return jsonify({'error': 'Card not found'}), 404
+	
 	return jsonify(result.data[0])
 
 
@@ -118,13 +127,14 @@ async def report_card_issue(user, card_id):
 		return jsonify({'error': 'Card not found'}), 404
 
 	# Create issue report
+	now_iso = datetime.now(timezone.utc).isoformat()
 	report_data = {
 		'user_id': user['user_id'],
 		'card_id': card_id,
 		'issue_type': data['issue_type'],
 		'description': data.get('description', ''),
 		'status': 'investigating',
-		'created_at': datetime.utcnow().isoformat()
+		'created_at': now_iso
 	}
 
 	report_result = supabase.table('card_issue_reports').insert(report_data).execute()
@@ -132,7 +142,7 @@ async def report_card_issue(user, card_id):
 	# Update card status to reported
 	supabase.table('cards').update({
 		'status': 'reported',
-		'updated_at': datetime.utcnow().isoformat()
+		'updated_at': now_iso
 	}).eq('id', card_id).execute()
 
 	# Send notification to user
@@ -145,17 +155,15 @@ async def report_card_issue(user, card_id):
 		f'<p>Your card ending in ****{card.data[0]["card_number"][-4:]} has been reported as {data["issue_type"]}.</p><p>Our security team will investigate and contact you within 24 hours.</p><p>For your protection, the card has been temporarily suspended.</p>'
 	)
 
-	# Send alert to admins (could be enhanced to send emails/SMS)
-	admin_users = supabase.table('users').select('id').eq('role', 'admin').execute()
-	for admin in admin_users.data:
-		await notify_user(
-			supabase,
-			admin['id'],
-			'admin_card_issue_alert',
-			f'Card issue reported: {data["issue_type"]} - User {user["user_id"]} - Card ****{card.data[0]["card_number"][-4:]}',
-			'Card Issue Alert',
-			f'<p>A card issue has been reported that requires admin attention.</p><p>User: {user["user_id"]}</p><p>Card: ****{card.data[0]["card_number"][-4:]}</p><p>Issue: {data["issue_type"]}</p><p>Description: {data.get("description", "None")}</p>'
-		)
+	# Send alert to admins - all admin notification rows are inserted in one
+	# RPC, which only the service role may execute
+	await notify_admins(
+		get_service_client(),
+		'admin_card_issue_alert',
+		f'Card issue reported: {data["issue_type"]} - User {user["user_id"]} - Card ****{card.data[0]["card_number"][-4:]}',
+		'Card Issue Alert',
+		f'<p>A card issue has been reported that requires admin attention.</p><p>User: {user["user_id"]}</p><p>Card: ****{card.data[0]["card_number"][-4:]}</p><p>Issue: {data["issue_type"]}</p><p>Description: {data.get("description", "None")}</p>'
+	)
 
 	logger.info(f"Card issue reported for user {user['user_id']}: {data['issue_type']} - Card ****{card.data[0]['card_number'][-4:]}")
 	return jsonify({'message': 'Card issue reported successfully', 'report_id': report_result.data[0]['id']})
@@ -164,12 +172,40 @@ async def report_card_issue(user, card_id):
 @cards_bp.route('/admin/issue-reports', methods=['GET'])
 @require_auth
 async def get_card_issue_reports(user):
-	"""Get all card issue reports (admin only)"""
+	"""Get card issue reports, newest first (admin only)
+
+	Query params:
+		limit: Page size (default 50, max 200)
+		cursor: "<created_at>,<id>" of the last report from the previous page
+
+	The next page's cursor is returned in the X-Next-Cursor header when more
+	reports may follow.
+	"""
 	if user.get('role') != 'admin':
 		return jsonify({'error': 'Admin access required'}), 403
 
-	reports = supabase.table('card_issue_reports').select('*, cards(card_number, card_brand, card_type), users(full_name, email)').execute()
-	return jsonify(reports.data)
+	# Keyset pagination on (created_at, id) - id breaks ties between reports
+	# created in the same instant (backed by idx_card_issue_reports_created_at_id)
+	limit = min(max(request.args.get('limit', ISSUE_REPORTS_PAGE_SIZE, type=int), 1), ISSUE_REPORTS_MAX_PAGE_SIZE)
+	cursor = request.args.get('cursor')
+
+	query = supabase.table('card_issue_reports').select('*, cards(card_number, card_brand, card_type), users(full_name, email)')
+	if cursor:
+		created_at, _, report_id = cursor.rpartition(',')
+		try:
+			# Parse both parts so nothing but a timestamp and a UUID reaches the filter
+			created_at = datetime.fromisoformat(created_at).isoformat()
+			report_id = str(uuid.UUID(report_id))
+		except ValueError:
+			return jsonify({'error': 'Invalid cursor'}), 400
+		query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{report_id})')
+	reports = query.order('created_at', desc=True).order('id', desc=True).limit(limit).execute()
+
+	data = reports.data or []
+	response = jsonify(data)
+	if len(data) == limit:
+		response.headers['X-Next-Cursor'] = f"{data[-1]['created_at']},{data[-1]['id']}"
+	return response
 
 
 @cards_bp.route('/admin/issue-reports/<report_id>/resolve', methods=['POST'])
@@ -189,19 +225,21 @@ async def resolve_card_issue_report(user, report_id):
 		return jsonify({'error': 'Report not found'}), 404
 
 	report_data = report.data[0]
+	now = datetime.now(timezone.utc)
+	now_iso = now.isoformat()
 
 	# Update report status
 	if action == 'block':
 		supabase.table('card_issue_reports').update({
 			'status': 'card_blocked',
 			'admin_notes': admin_notes,
-			'resolved_at': datetime.utcnow().isoformat()
+			'resolved_at': now_iso
 		}).eq('id', report_id).execute()
 
 		# Block the card permanently
 		supabase.table('cards').update({
 			'status': 'blocked',
-			'updated_at': datetime.utcnow().isoformat()
+			'updated_at': now_iso
 		}).eq('id', report_data['card_id']).execute()
 
 		# Notify user
@@ -218,7 +256,7 @@ async def resolve_card_issue_report(user, report_id):
 		supabase.table('card_issue_reports').update({
 			'status': 'resolved',
 			'admin_notes': admin_notes,
-			'resolved_at': datetime.utcnow().isoformat()
+			'resolved_at': now_iso
 		}).eq('id', report_id).execute()
 
 		# Generate new card for the user
@@ -228,9 +266,9 @@ async def resolve_card_issue_report(user, report_id):
 		supabase.table('cards').update({
 			'card_number': new_card_number,
 			'cvv': new_cvv,
-			'expiry_date': (datetime.utcnow() + timedelta(days=CARD_EXPIRY_DAYS)).strftime('%m/%y'),
+			'expiry_date': (now + timedelta(days=CARD_EXPIRY_DAYS)).strftime('%m/%y'),
 			'status': 'active',
-			'updated_at': datetime.utcnow().isoformat()
+			'updated_at': now_iso
 		}).eq('id', report_data['card_id']).execute()
 
 		# Notify user of new card
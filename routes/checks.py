@@ -2,11 +2,11 @@
 Checks routes for Concierge Bank
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from quart import Blueprint, request, jsonify
 
 from core import get_supabase_client
-from auth import require_auth, require_transactions_enabled
+from auth import require_auth, require_transactions_enabled, verify_transaction_pin, get_user_row
 from utils import verify_account_ownership, update_account_balance, create_transaction_record
 from services import notify_user
 from templates import check_deposit_email, check_order_email
@@ -32,27 +32,9 @@ async def deposit_check(user):
 	data = await request.get_json()
 	
 	# Verify PIN first
-	provided_pin = data.get('pin')
-	if not provided_pin:
-		return jsonify({'error': 'Transaction PIN is required'}), 400
-	
-	if not isinstance(provided_pin, str) or not provided_pin.isdigit() or len(provided_pin) != 6:
-		return jsonify({'error': 'Transaction PIN must be exactly 6 digits'}), 400
-	
-	# Verify PIN against database
-	try:
-		user_data = supabase.table('users').select('transaction_pin_hash').eq('id', user['user_id']).single().execute()
-		stored_hash = user_data.data.get('transaction_pin_hash') if user_data.data else None
-		
-		if not stored_hash:
-			return jsonify({'error': 'Transaction PIN not set. Please contact support.'}), 400
-		
-		# Verify PIN - compare plain text
-		if provided_pin != stored_hash:
-			return jsonify({'error': 'Invalid transaction PIN'}), 403
-	except Exception as e:
-		logger.error(f"Failed to verify PIN for user {user['user_id']}: {e}")
-		return jsonify({'error': 'PIN verification failed. Please try again.'}), 500
+	pin_error = await verify_transaction_pin(user['user_id'], data.get('pin'))
+	if pin_error:
+		return pin_error
 	
 	# Validate required fields
 	if not data.get('account_id'):
@@ -82,7 +64,7 @@ async def deposit_check(user):
 		'check_number': data.get('check_number', '').strip(),
 		'amount': amount,
 		'status': 'pending',  # Checks need time to clear
-		'created_at': datetime.utcnow().isoformat()
+		'created_at': datetime.now(timezone.utc).isoformat()
 	}
 	
 	result = supabase.table('checks').insert(check_data).execute()
@@ -102,17 +84,21 @@ async def deposit_check(user):
 	)
 	
 	# Send notification
-	html = check_deposit_email(float(data['amount']), data.get('check_number', 'N/A'))
+	html = check_deposit_email(amount, data.get('check_number', 'N/A'))
+	# Already loaded by the transactions-enabled and PIN checks
+	user_row = await get_user_row(user['user_id'])
 	await notify_user(
 		supabase,
 		user['user_id'],
 		'check_deposit',
-		f'Check deposit of ${float(data["amount"]):,.2f}',
+		f'Check deposit of ${amount:,.2f}',
 		'Check Deposit Confirmation',
-		html
+		html,
+		prefs=user_row.get('notification_preferences') or {},
+		email=user_row.get('email')
 	)
 	
-	logger.info(f"Check deposited for user {user['user_id']}: ${float(data['amount']):.2f}")
+	logger.info(f"Check deposited for user {user['user_id']}: ${amount:.2f}")
 	return jsonify(result.data[0]), 201
 
 
@@ -150,7 +136,7 @@ async def order_checks(user):
 		'design': data.get('design', 'Standard'),
 		'quantity': quantity,
 		'status': 'processing',
-		'created_at': datetime.utcnow().isoformat()
+		'created_at': datetime.now(timezone.utc).isoformat()
 	}
 	
 	result = supabase.table('check_orders').insert(order_data).execute()
@@ -158,7 +144,7 @@ async def order_checks(user):
 	# Send notification
 	html = check_order_email(
 		data.get('design', 'Standard'),
-		int(data.get('quantity', 50)),
+		quantity,
 		float(data.get('price', 29.99))
 	)
 	await notify_user(
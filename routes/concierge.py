@@ -1,18 +1,25 @@
 """
 Concierge routes for Concierge Bank - AI assistant and service requests
 """
+import asyncio
 import logging
 import json
+import re
+import uuid
 from quart import Blueprint, request, jsonify
 
 from core import get_supabase_client
 from auth import require_auth
-from services import notify_user
+from services import notify_user, get_admin_ids
+from templates import concierge_request_email, concierge_request_alert_email
 
 logger = logging.getLogger(__name__)
 concierge_bp = Blueprint('concierge', __name__, url_prefix='/api/concierge')
 supabase = get_supabase_client()
 
+# Max admin notifications sent concurrently per concierge request
+ADMIN_NOTIFY_CONCURRENCY = 10
+
 
 @concierge_bp.route('/chat', methods=['POST'])
 @require_auth
@@ -40,7 +47,7 @@ async def send_message(user):
 	# In production, you'd want to store conversations
 
 	concierge_message = {
-		'id': 'temp_' + str(hash(message)),  # Temporary ID for demo
+		'id': f'temp_{uuid.uuid4().hex}',  # Temporary ID for demo
 		'user_id': user['user_id'],
 		'message': message,
 		'response': response_text,
@@ -73,29 +80,42 @@ async def create_request(user):
 	}
 
 	# For demo, we'll simulate storing and notify
-	request_id = 'req_' + str(hash(f"{user['user_id']}{request_type}{details}"))
-
-	# Send notification to user
-	await notify_user(
-		supabase,
-		user['user_id'],
-		'concierge_request',
-		f'Your {request_type} request has been submitted. Our concierge team will contact you within 24 hours.',
-		'Concierge Request Submitted',
-		f'<p>Thank you for your {request_type} request.</p><p><strong>Details:</strong> {details}</p><p>Our concierge team will review your request and contact you within 24 hours.</p>'
-	)
-
-	# Send notification to admin/concierge team
-	admin_users = supabase.table('users').select('id').eq('role', 'admin').execute()
-	for admin in admin_users.data:
-		await notify_user(
+	request_id = f'req_{uuid.uuid4().hex}'
+
+	# Notify the user and fan out to the admin/concierge team concurrently,
+	# capping in-flight admin notifications so a large team doesn't open
+	# an unbounded number of email sessions at once
+	semaphore = asyncio.Semaphore(ADMIN_NOTIFY_CONCURRENCY)
+	admin_message = f'New concierge request: {request_type} from user {user["user_id"]}'
+	admin_html = concierge_request_alert_email(request_type, user['user_id'], details)
+
+	async def notify_admin(admin_id: str) -> None:
+		async with semaphore:
+			await notify_user(
+				supabase,
+				admin_id,
+				'concierge_request_alert',
+				admin_message,
+				'New Concierge Request',
+				admin_html
+			)
+
+	admin_ids = await get_admin_ids(supabase)
+	notify_results = await asyncio.gather(
+		notify_user(
 			supabase,
-			admin['id'],
-			'concierge_request_alert',
-			f'New concierge request: {request_type} from user {user["user_id"]}',
-			'New Concierge Request',
-			f'<p><strong>Request Type:</strong> {request_type}</p><p><strong>User:</strong> {user["user_id"]}</p><p><strong>Details:</strong> {details}</p><p>Please review and respond promptly.</p>'
-		)
+			user['user_id'],
+			'concierge_request',
+			f'Your {request_type} request has been submitted. Our concierge team will contact you within 24 hours.',
+			'Concierge Request Submitted',
+			concierge_request_email(request_type, details)
+		),
+		*(notify_admin(admin_id) for admin_id in admin_ids),
+		return_exceptions=True
+	)
+	for notify_result in notify_results:
+		if isinstance(notify_result, Exception):
+			logger.error(f"Concierge request notification failed for user {user['user_id']}: {notify_result}")
 
 	logger.info(f"Concierge request created: {request_type} - User {user['user_id']}")
 	return jsonify({
@@ -107,37 +127,34 @@ async def create_request(user):
 	}), 201
 
 
-def generate_concierge_response(message: str) -> str:
-	"""Generate simulated AI concierge responses based on message content"""
-
-	message_lower = message.lower()
-
+# Keyword categories checked in priority order - each compiled once at import
+# so classifying a message is one C-level scan per category instead of a
+# Python loop over every keyword. Matching is substring-based, as before.
+CONCIERGE_RESPONSES = [
 	# Banking questions
-	if any(word in message_lower for word in ['balance', 'account', 'checking', 'savings']):
-		return "I'd be happy to help you with your account information. You can view your account balances and transaction history in your dashboard. For security reasons, I can't provide specific balance information here. Is there anything specific about your accounts you'd like to know?"
-
-	elif any(word in message_lower for word in ['transfer', 'send money', 'wire']):
-		return "For transfers and payments, you have several options through your Concierge Bank dashboard: internal transfers between your accounts, external transfers to other banks, bill payments, and check deposits. Would you like me to guide you through any of these processes?"
+	(re.compile(r'balance|account|checking|savings'), "I'd be happy to help you with your account information. You can view your account balances and transaction history in your dashboard. For security reasons, I can't provide specific balance information here. Is there anything specific about your accounts you'd like to know?"),
+	(re.compile(r'transfer|send money|wire'), "For transfers and payments, you have several options through your Concierge Bank dashboard: internal transfers between your accounts, external transfers to other banks, bill payments, and check deposits. Would you like me to guide you through any of these processes?"),
+	(re.compile(r'card|credit|debit|atm'), "Your Concierge Bank cards offer premium benefits including worldwide acceptance, contactless payments, and concierge support. You can manage your cards, report lost/stolen cards, and set spending limits through your dashboard. How can I assist with your cards?"),
+	# Investment/wealth management
+	(re.compile(r'invest|stock|portfolio|wealth'), "Concierge Bank offers personalized wealth management services. Our relationship managers can help you with investment planning, portfolio management, and financial advisory services. Would you like me to connect you with a wealth management specialist?"),
+	# Premium services
+	(re.compile(r'concierge|limousine|travel|reservation'), "As a Concierge Bank client, you have access to our premium concierge services including travel arrangements, reservations, personal shopping assistance, and lifestyle management. Our concierge team is available 24/7 to assist with any special requests."),
+	# Security
+	(re.compile(r'security|fraud|suspicious'), "Security is our top priority at Concierge Bank. If you notice any suspicious activity, please contact us immediately or use the 'Report Issue' feature in your dashboard. We monitor all accounts 24/7 and use advanced security measures to protect your assets."),
+	# General assistance
+	(re.compile(r'help|support|contact'), "I'm here to help! You can reach our concierge support team 24/7 at 1-800-CONCIERGE or through this chat. For account-specific issues, you can also use the support options in your dashboard. What can I assist you with today?"),
+]
 
-	elif any(word in message_lower for word in ['card', 'credit', 'debit', 'atm']):
-		return "Your Concierge Bank cards offer premium benefits including worldwide acceptance, contactless payments, and concierge support. You can manage your cards, report lost/stolen cards, and set spending limits through your dashboard. How can I assist with your cards?"
+DEFAULT_CONCIERGE_RESPONSE = "Thank you for your message. As your Concierge Bank assistant, I'm here to help with all your banking needs, from account management to premium services. Could you please provide more details about how I can assist you today?"
 
-	# Investment/wealth management
-	elif any(word in message_lower for word in ['invest', 'stock', 'portfolio', 'wealth']):
-		return "Concierge Bank offers personalized wealth management services. Our relationship managers can help you with investment planning, portfolio management, and financial advisory services. Would you like me to connect you with a wealth management specialist?"
 
-	# Premium services
-	elif any(word in message_lower for word in ['concierge', 'limousine', 'travel', 'reservation']):
-		return "As a Concierge Bank client, you have access to our premium concierge services including travel arrangements, reservations, personal shopping assistance, and lifestyle management. Our concierge team is available 24/7 to assist with any special requests."
+def generate_concierge_response(message: str) -> str:
+	"""Generate simulated AI concierge responses based on message content"""
 
-	# Security
-	elif any(word in message_lower for word in ['security', 'fraud', 'suspicious']):
-		return "Security is our top priority at Concierge Bank. If you notice any suspicious activity, please contact us immediately or use the 'Report Issue' feature in your dashboard. We monitor all accounts 24/7 and use advanced security measures to protect your assets."
+	message_lower = message.lower()
 
-	# General assistance
-	elif any(word in message_lower for word in ['help', 'support', 'contact']):
-		return "I'm here to help! You can reach our concierge support team 24/7 at 1-800-CONCIERGE or through this chat. For account-specific issues, you can also use the support options in your dashboard. What can I assist you with today?"
+	for pattern, response in CONCIERGE_RESPONSES:
+		if pattern.search(message_lower):
+			return response
 
-	# Default response
-	else:
-		return "Thank you for your message. As your Concierge Bank assistant, I'm here to help with all your banking needs, from account management to premium services. Could you please provide more details about how I can assist you today?"
+	return DEFAULT_CONCIERGE_RESPONSE
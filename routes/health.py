@@ -1,7 +1,7 @@
 """
 Health check route for Concierge Bank
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from quart import Blueprint, jsonify
 
 health_bp = Blueprint('health', __name__)
@@ -12,5 +12,5 @@ async def health_check():
 	"""Health check endpoint"""
 	return jsonify({
 		'status': 'healthy',
-		'timestamp': datetime.utcnow().isoformat()
+		'timestamp': datetime.now(timezone.utc).isoformat()
 	})
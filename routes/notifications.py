@@ -1,9 +1,9 @@
 """
 Notifications routes for Concierge Bank
 """
-from quart import Blueprint, jsonify
+from quart import Blueprint, request, jsonify
 
-from core import get_supabase_client
+from core import get_supabase_client, execute_async
 from auth import require_auth
 
 notifications_bp = Blueprint('notifications', __name__, url_prefix='/api/notifications')
@@ -13,8 +13,12 @@ supabase = get_supabase_client()
 @notifications_bp.route('', methods=['GET'])
 @require_auth
 async def get_notifications(user):
-	"""Get user notifications"""
-	notifications = supabase.table('notifications').select('*').eq('user_id', user['user_id']).eq('delivery_method', 'push').order('created_at', desc=True).limit(50).execute()
+	"""Get user notifications
+	
+	Defaults to in-app (push) notifications; pass ?channel=email etc. to list another delivery channel.
+	"""
+	channel = request.args.get('channel', 'push')
+	notifications = await execute_async(supabase.table('notifications').select('id, type, title, message, delivery_method, read, created_at').eq('user_id', user['user_id']).eq('delivery_method', channel).order('created_at', desc=True).limit(50))
 	return jsonify(notifications.data)
 
 
@@ -22,11 +26,10 @@ async def get_notifications(user):
 @require_auth
 async def mark_notification_read(user, notification_id):
 	"""Mark single notification as read"""
-	result = supabase.table('notifications')\
+	result = await execute_async(supabase.table('notifications')\
 		.update({'read': True})\
 		.eq('id', notification_id)\
-		.eq('user_id', user['user_id'])\
-		.execute()
+		.eq('user_id', user['user_id']))
 	return jsonify({'message': 'Marked as read'})
 
 
@@ -34,8 +37,7 @@ async def mark_notification_read(user, notification_id):
 @require_auth
 async def mark_all_read(user):
 	"""Mark all notifications as read"""
-	result = supabase.table('notifications')\
+	result = await execute_async(supabase.table('notifications')\
 		.update({'read': True})\
-		.eq('user_id', user['user_id'])\
-		.execute()
+		.eq('user_id', user['user_id']))
 	return jsonify({'message': 'All marked as read'})
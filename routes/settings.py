@@ -1,26 +1,50 @@
 """
 Settings routes for Concierge Bank
 """
+import hashlib
 import logging
-from datetime import datetime
-from quart import Blueprint, request, jsonify
-from supabase import create_client
+from datetime import datetime, timezone
+from typing import Any
+from quart import Blueprint, Response, current_app, request, jsonify
 
-from core import get_supabase_client
-from core.config import SUPABASE_URL, SUPABASE_KEY
-from auth import require_auth
+from core import get_supabase_client, execute_async, auth_api
+from auth import require_auth, get_user_row
+from services import get_user_profile, invalidate_user_profile
 
 logger = logging.getLogger(__name__)
 settings_bp = Blueprint('settings', __name__, url_prefix='/api/settings')
 supabase = get_supabase_client()
 
+# Users columns each PUT endpoint may change; anything else in the body is ignored
+_ALLOWED_PROFILE_FIELDS = frozenset({'full_name', 'phone', 'address', 'preferred_brand', 'photo_url'})
+_ALLOWED_SETTINGS_FIELDS = _ALLOWED_PROFILE_FIELDS | {'notification_preferences'}
+
+
+def _conditional_json(payload: Any) -> Response:
+	"""JSON response with an ETag, or an empty 304 if the client's copy is current
+	
+	The ETag hashes the serialized body, so any change to the data (from any
+	endpoint) produces a new tag. Clients must revalidate on every use.
+	"""
+	body = current_app.json.dumps(payload)
+	etag = hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+	if request.if_none_match.contains_weak(etag):
+		response = current_app.response_class('', status=304)
+	else:
+		response = current_app.response_class(body, mimetype='application/json')
+	response.set_etag(etag)
+	response.headers['Cache-Control'] = 'private, no-cache'
+	return response
+
 
 @settings_bp.route('', methods=['GET'])
 @require_auth
 async def get_settings(user):
 	"""Get user settings (same as user profile)"""
-	user_data = supabase.table('users').select('*').eq('id', user['user_id']).single().execute()
-	return jsonify(user_data.data)
+	profile = await get_user_profile(supabase, user['user_id'])
+	if not profile:
+		return jsonify({'error': 'User not found'}), 404
+	return _conditional_json(profile)
 
 
 @settings_bp.route('', methods=['PUT'])
@@ -29,11 +53,11 @@ async def update_settings(user):
 	"""Update user settings"""
 	data = await request.get_json()
 	
-	allowed_fields = ['full_name', 'phone', 'address', 'preferred_brand', 'photo_url', 'notification_preferences']
-	update_data = {k: v for k, v in data.items() if k in allowed_fields}
-	update_data['updated_at'] = datetime.utcnow().isoformat()
+	update_data = {k: data[k] for k in _ALLOWED_SETTINGS_FIELDS & data.keys()}
+	update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
 	
-	result = supabase.table('users').update(update_data).eq('id', user['user_id']).execute()
+	result = await execute_async(supabase.table('users').update(update_data).eq('id', user['user_id']))
+	invalidate_user_profile(user['user_id'])
 	logger.info(f"Settings updated for user {user['user_id']}")
 	return jsonify(result.data[0])
 
@@ -45,21 +69,12 @@ async def update_profile(user):
 	data = await request.get_json()
 	
 	# Extract allowed profile fields
-	profile_data = {}
-	if 'full_name' in data:
-		profile_data['full_name'] = data['full_name']
-	if 'phone' in data:
-		profile_data['phone'] = data['phone']
-	if 'address' in data:
-		profile_data['address'] = data['address']
-	if 'preferred_brand' in data:
-		profile_data['preferred_brand'] = data['preferred_brand']
-	if 'photo_url' in data:
-		profile_data['photo_url'] = data['photo_url']
+	profile_data = {k: data[k] for k in _ALLOWED_PROFILE_FIELDS & data.keys()}
 	
-	profile_data['updated_at'] = datetime.utcnow().isoformat()
+	profile_data['updated_at'] = datetime.now(timezone.utc).isoformat()
 	
-	result = supabase.table('users').update(profile_data).eq('id', user['user_id']).execute()
+	result = await execute_async(supabase.table('users').update(profile_data).eq('id', user['user_id']))
+	invalidate_user_profile(user['user_id'])
 	logger.info(f"Profile updated for user {user['user_id']}")
 	return jsonify(result.data[0])
 
@@ -74,25 +89,20 @@ async def change_password(user):
 		return jsonify({'error': 'Current and new password required'}), 400
 	
 	try:
-		# Get Supabase client with user context
-		supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
-		
-		# Verify current password by attempting to sign in
-		user_data = supabase.table('users').select('email').eq('id', user['user_id']).single().execute()
-		email = user_data.data['email']
+		# Verify current password by attempting to sign in (over the shared,
+		# pooled auth HTTP client rather than a new Supabase client). The
+		# email is in the JWT, so no users lookup is needed.
+		email = user.get('email') or (await get_user_row(user['user_id']))['email']
 		
 		try:
-			auth_response = supabase_client.auth.sign_in_with_password({
-				'email': email,
-				'password': data['current_password']
-			})
-			if not auth_response.user:
+			session = await auth_api.sign_in_with_password(email, data['current_password'])
+			if not session or not session.get('access_token'):
 				return jsonify({'error': 'Current password is incorrect'}), 401
 		except Exception:
 			return jsonify({'error': 'Current password is incorrect'}), 401
 		
-		# Update password using Supabase auth
-		supabase_client.auth.update_user({
+		# Update password with the service-role admin API
+		await auth_api.admin_update_user(user['user_id'], {
 			'password': data['new_password']
 		})
 		
@@ -108,8 +118,10 @@ async def change_password(user):
 @require_auth
 async def get_notification_preferences(user):
 	"""Get notification preferences"""
-	user_data = supabase.table('users').select('notification_preferences').eq('id', user['user_id']).single().execute()
-	return jsonify(user_data.data.get('notification_preferences', {}))
+	profile = await get_user_profile(supabase, user['user_id'])
+	if not profile:
+		return jsonify({'error': 'User not found'}), 404
+	return _conditional_json(profile.get('notification_preferences') or {})
 
 
 @settings_bp.route('/notifications', methods=['PUT'])
@@ -120,9 +132,10 @@ async def update_notification_preferences(user):
 	
 	update_data = {
 		'notification_preferences': data,
-		'updated_at': datetime.utcnow().isoformat()
+		'updated_at': datetime.now(timezone.utc).isoformat()
 	}
 	
-	result = supabase.table('users').update(update_data).eq('id', user['user_id']).execute()
+	result = await execute_async(supabase.table('users').update(update_data).eq('id', user['user_id']))
+	invalidate_user_profile(user['user_id'])
 	logger.info(f"Notification preferences updated for user {user['user_id']}")
 	return jsonify(result.data[0]['notification_preferences'])
@@ -1,63 +1,56 @@
 """
 Transfers routes for Concierge Bank
 """
+import asyncio
 import logging
-from datetime import datetime
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from quart import Blueprint, request, jsonify
+from postgrest.exceptions import APIError
 
-from core import get_supabase_client
-from auth import require_auth, require_transactions_enabled
-from utils import verify_account_ownership, check_sufficient_balance, update_account_balance, create_transaction_record
-from services import notify_user
+from core import get_supabase_client, get_service_client, execute_async
+from auth import require_auth, require_transactions_enabled, verify_transaction_pin, get_user_row
+from utils import verify_account_ownership, check_sufficient_balance, ROUTING_NUMBER_RE, EXTERNAL_ACCOUNT_NUMBER_RE
+from services import notify_user, run_in_background
 from templates import transfer_confirmation_email
 
 logger = logging.getLogger(__name__)
 transfers_bp = Blueprint('transfers', __name__, url_prefix='/api/transfers')
 supabase = get_supabase_client()
 
+CENT = Decimal('0.01')
+MAX_TRANSFER_AMOUNT = Decimal('1000000')
+
+# SQLSTATEs raised by the execute_transfer stored procedure
+INSUFFICIENT_FUNDS_ERRCODE = 'CB001'
+DESTINATION_NOT_FOUND_ERRCODE = 'CB002'
+
+# Transfer history page size (?limit=) default and cap
+TRANSFER_HISTORY_PAGE_SIZE = 100
+TRANSFER_HISTORY_MAX_PAGE_SIZE = 200
+
 
 @transfers_bp.route('', methods=['GET'])
 @require_auth
 async def get_transfers(user):
-	"""Get user's transfer history - includes sent and received transfers"""
+	"""Get user's transfer history - includes sent and received transfers
+	
+	Newest first, paginated with ?limit=&offset=.
+	"""
+	limit = min(max(request.args.get('limit', TRANSFER_HISTORY_PAGE_SIZE, type=int), 1), TRANSFER_HISTORY_MAX_PAGE_SIZE)
+	offset = max(request.args.get('offset', 0, type=int), 0)
+	
 	try:
-		# Get current user's email and phone for P2P matching
-		user_data = supabase.table('users').select('email, phone').eq('id', user['user_id']).single().execute()
-		user_email = user_data.data.get('email') if user_data.data else None
-		user_phone = user_data.data.get('phone') if user_data.data else None
-		
-		# Get transfers where user is the sender
-		sent_transfers = supabase.table('transfers').select('*').eq('user_id', user['user_id']).execute()
-		
-		# Get all P2P transfers to check if any are addressed to this user
-		all_p2p_transfers = supabase.table('transfers').select('*').eq('transfer_type', 'p2p').execute()
-		
-		# Filter P2P transfers received by this user (matching email or phone)
-		received_transfers = []
-		if all_p2p_transfers.data:
-			for transfer in all_p2p_transfers.data:
-				# Skip if this user sent it (already in sent_transfers)
-				if transfer.get('user_id') == user['user_id']:
-					continue
-					
-				to_external = transfer.get('to_external', {})
-				recipient_email = to_external.get('email', '').lower() if to_external.get('email') else None
-				recipient_phone = to_external.get('phone', '').strip() if to_external.get('phone') else None
-				
-				# Check if transfer is addressed to this user's email or phone
-				if (user_email and recipient_email and recipient_email == user_email.lower()) or \
-				   (user_phone and recipient_phone and recipient_phone == user_phone):
-					# Mark this as received transfer for display purposes
-					transfer['direction'] = 'received'
-					received_transfers.append(transfer)
-		
-		# Combine sent and received transfers
-		all_transfers = (sent_transfers.data or []) + received_transfers
-		
-		# Sort by created_at descending
-		all_transfers.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-		
-		logger.info(f"Fetched {len(sent_transfers.data or [])} sent and {len(received_transfers)} received transfers for user {user['user_id']}")
+		# Sent transfers and P2P transfers addressed to the user's email/phone
+		# are matched, ordered and paged in the database by one RPC
+		transfers = await execute_async(supabase.rpc('get_user_transfers', {
+			'uid': user['user_id'],
+			'max_rows': limit,
+			'skip_rows': offset
+		}))
+		all_transfers = transfers.data or []
+		
+		received_count = sum(1 for transfer in all_transfers if transfer.get('direction') == 'received')
+		logger.info(f"Fetched {len(all_transfers) - received_count} sent and {received_count} received transfers for user {user['user_id']}")
 		if all_transfers:
 			logger.debug(f"Transfer types: {[t.get('transfer_type') for t in all_transfers[:5]]}")
 		
@@ -74,28 +67,16 @@ async def create_transfer(user):
 	"""Create transfer with full validation and proper handling"""
 	data = await request.get_json()
 	
-	# Verify PIN first
-	provided_pin = data.get('pin')
-	if not provided_pin:
-		return jsonify({'error': 'Transaction PIN is required'}), 400
-	
-	if not isinstance(provided_pin, str) or not provided_pin.isdigit() or len(provided_pin) != 6:
-		return jsonify({'error': 'Transaction PIN must be exactly 6 digits'}), 400
-	
-	# Verify PIN against database
-	try:
-		user_data = supabase.table('users').select('transaction_pin_hash').eq('id', user['user_id']).single().execute()
-		stored_hash = user_data.data.get('transaction_pin_hash') if user_data.data else None
-		
-		if not stored_hash:
-			return jsonify({'error': 'Transaction PIN not set. Please contact support.'}), 400
-		
-		# Verify PIN - compare plain text
-		if provided_pin != stored_hash:
-			return jsonify({'error': 'Invalid transaction PIN'}), 403
-	except Exception as e:
-		logger.error(f"Failed to verify PIN for user {user['user_id']}: {e}")
-		return jsonify({'error': 'PIN verification failed. Please try again.'}), 500
+	# Verify PIN first, loading the source account alongside it
+	if data.get('from_account_id'):
+		pin_error, (success, from_account, error) = await asyncio.gather(
+			verify_transaction_pin(user['user_id'], data.get('pin')),
+			verify_account_ownership(supabase, data['from_account_id'], user['user_id'])
+		)
+	else:
+		pin_error = await verify_transaction_pin(user['user_id'], data.get('pin'))
+	if pin_error:
+		return pin_error
 	
 	# Validate required fields
 	if not data.get('from_account_id'):
@@ -103,15 +84,18 @@ async def create_transfer(user):
 	if not data.get('amount'):
 		return jsonify({'error': 'Amount is required'}), 400
 	
-	# Validate amount
+	# Validate amount - parsed once to a cent-exact Decimal and reused for
+	# the balance check, the transfer write, the email and the logs
 	try:
-		amount = float(data['amount'])
-	except (ValueError, TypeError):
+		amount = Decimal(str(data['amount'])).quantize(CENT, rounding=ROUND_HALF_UP)
+	except (InvalidOperation, ValueError, TypeError):
+		return jsonify({'error': 'Invalid amount format'}), 400
+	if not amount.is_finite():
 		return jsonify({'error': 'Invalid amount format'}), 400
 	
-	if amount < 0.01:
+	if amount < CENT:
 		return jsonify({'error': 'Amount must be at least $0.01'}), 400
-	if amount > 1000000:
+	if amount > MAX_TRANSFER_AMOUNT:
 		return jsonify({'error': 'Transfer amount exceeds maximum limit of $1,000,000'}), 400
 	
 	# Validate transfer type
@@ -120,9 +104,9 @@ async def create_transfer(user):
 		return jsonify({'error': 'Invalid transfer type. Must be internal, external, or p2p'}), 400
 	
 	description = data.get('description', '').strip()[:200]  # Limit description length
+	to_external = data.get('to_external') or {}
 	
 	# Verify source account ownership and balance
-	success, from_account, error = await verify_account_ownership(supabase, data['from_account_id'], user['user_id'])
 	if not success:
 		return jsonify({'error': error}), 400
 	
@@ -148,25 +132,23 @@ async def create_transfer(user):
 		status = 'completed'
 		
 	elif transfer_type == 'external':
-		external = data.get('to_external', {})
-		account_num = external.get('account_number', '')
-		routing_num = external.get('routing_number', '')
+		account_num = to_external.get('account_number', '')
+		routing_num = to_external.get('routing_number', '')
 		
 		# Validate external bank info
 		if not account_num or not routing_num:
 			return jsonify({'error': 'Account and routing numbers required'}), 400
-		if len(routing_num) != 9 or not routing_num.isdigit():
+		if not ROUTING_NUMBER_RE.fullmatch(routing_num):
 			return jsonify({'error': 'Invalid routing number (must be 9 digits)'}), 400
-		if not account_num.isdigit() or len(account_num) < 4:
+		if not EXTERNAL_ACCOUNT_NUMBER_RE.fullmatch(account_num):
 			return jsonify({'error': 'Invalid account number'}), 400
 		
-		recipient_name = external.get('name', f"External account ••••{account_num[-4:]}")
+		recipient_name = to_external.get('name', f"External account ••••{account_num[-4:]}")
 		status = 'pending'  # External transfers take 1-3 business days
 		
 	elif transfer_type == 'p2p':
-		external = data.get('to_external', {})
-		email = external.get('email', '')
-		phone = external.get('phone', '')
+		email = to_external.get('email', '')
+		phone = to_external.get('phone', '')
 		
 		if not email and not phone:
 			return jsonify({'error': 'Email or phone required for P2P transfer'}), 400
@@ -174,105 +156,76 @@ async def create_transfer(user):
 		recipient_name = email or phone
 		status = 'pending'  # P2P requires recipient acceptance
 	
-	# Create transfer record
-	transfer_data = {
-		'user_id': user['user_id'],
-		'from_account_id': data['from_account_id'],
-		'to_account_id': data.get('to_account_id'),
-		'to_external': data.get('to_external', {}),
-		'amount': amount,
-		'transfer_type': transfer_type,
-		'status': status,
-		'created_at': datetime.utcnow().isoformat()
-	}
-	
-	logger.info(f"Creating transfer: type={transfer_type}, user={user['user_id']}, amount=${amount}, to={recipient_name}")
-	logger.debug(f"Transfer data: {transfer_data}")
-	result = supabase.table('transfers').insert(transfer_data).execute()
-	logger.info(f"Transfer created with ID: {result.data[0]['id'] if result.data else 'unknown'}")
-	
-	# Debit source account
-	new_from_balance = from_account['balance'] - amount
-	await update_account_balance(supabase, data['from_account_id'], new_from_balance)
-	
-	# Create debit transaction
-	tx_description = description or f"Transfer to {recipient_name}"
-	await create_transaction_record(
-		supabase,
-		data['from_account_id'],
-		'debit',
-		amount,
-		tx_description,
-		'transfer'
-	)
-	
-	# For internal transfers, credit destination account immediately
-	if transfer_type == 'internal' and data.get('to_account_id'):
-		new_to_balance = to_account['balance'] + amount
-		await update_account_balance(supabase, data['to_account_id'], new_to_balance)
-		
-		# Create credit transaction for recipient
-		await create_transaction_record(
-			supabase,
-			data['to_account_id'],
-			'credit',
-			amount,
-			f"Transfer from {from_account['account_type']} account",
-			'transfer'
-		)
-	
-	# For P2P transfers, check if recipient exists in system and auto-credit if they do
-	if transfer_type == 'p2p':
-		recipient_email = data.get('to_external', {}).get('email', '').lower()
-		recipient_phone = data.get('to_external', {}).get('phone', '')
+	# Resolve the account to credit: the destination account for internal
+	# transfers, or for P2P the recipient's primary account if they are a
+	# registered user
+	to_account_id = data.get('to_account_id')
+	credit_description = None
+	if transfer_type == 'internal':
+		credit_description = f"Transfer from {from_account['account_type']} account"
+	elif transfer_type == 'p2p':
+		recipient_email = email.lower()
+		recipient_phone = phone
 		
 		# Try to find recipient user by email or phone
 		recipient_user = None
 		if recipient_email:
-			recipient_result = supabase.table('users').select('id, email').eq('email', recipient_email).execute()
+			recipient_result = await execute_async(supabase.table('users').select('id, email').eq('email', recipient_email))
 			if recipient_result.data:
 				recipient_user = recipient_result.data[0]
 		elif recipient_phone:
-			recipient_result = supabase.table('users').select('id, phone').eq('phone', recipient_phone).execute()
+			recipient_result = await execute_async(supabase.table('users').select('id, phone').eq('phone', recipient_phone))
 			if recipient_result.data:
 				recipient_user = recipient_result.data[0]
 		
-		# If recipient exists, auto-complete the transfer to their primary account
+		# If recipient exists, complete the transfer to their primary account
 		if recipient_user:
 			# Get recipient's primary (first) account
-			recipient_accounts = supabase.table('accounts').select('*').eq('user_id', recipient_user['id']).limit(1).execute()
+			recipient_accounts = await execute_async(supabase.table('accounts').select('id').eq('user_id', recipient_user['id']).limit(1))
 			
 			if recipient_accounts.data:
-				recipient_account = recipient_accounts.data[0]
-				
-				# Credit recipient's account
-				new_recipient_balance = recipient_account['balance'] + amount
-				await update_account_balance(supabase, recipient_account['id'], new_recipient_balance)
-				
-				# Create credit transaction for recipient
-				await create_transaction_record(
-					supabase,
-					recipient_account['id'],
-					'credit',
-					amount,
-					f"P2P transfer from {user.get('email', 'another user')}",
-					'transfer'
-				)
-				
-				# Update transfer status to completed and link recipient account
-				supabase.table('transfers').update({
-					'status': 'completed',
-					'to_account_id': recipient_account['id']
-				}).eq('id', result.data[0]['id']).execute()
-				
-				logger.info(f"P2P transfer auto-completed for registered user {recipient_user['id']}")
+				to_account_id = recipient_accounts.data[0]['id']
+				credit_description = f"P2P transfer from {user.get('email', 'another user')}"
 				status = 'completed'
+				logger.info(f"P2P transfer auto-completed for registered user {recipient_user['id']}")
 			else:
 				logger.warning(f"Recipient user {recipient_user['id']} has no accounts")
 		else:
 			logger.info(f"P2P recipient not found in system - transfer remains pending")
 	
-	# Send email notification
+	# Debit, credit, both transaction records and the transfer record are
+	# written by one stored procedure in a single database transaction. It
+	# re-checks the balance atomically, so concurrent transfers can't overdraw.
+	logger.info(f"Creating transfer: type={transfer_type}, user={user['user_id']}, amount=${amount}, to={recipient_name}")
+	try:
+		result = await execute_async(get_service_client().rpc('execute_transfer', {
+			'p_user': user['user_id'],
+			'p_from': data['from_account_id'],
+			'p_to': to_account_id,
+			'p_amount': str(amount),  # exact numeric; the JSON encoder can't send Decimal
+			'p_type': transfer_type,
+			'p_external': to_external,
+			'p_status': status,
+			'p_debit_description': description or f"Transfer to {recipient_name}",
+			'p_credit_description': credit_description
+		}))
+	except APIError as e:
+		if e.code == INSUFFICIENT_FUNDS_ERRCODE:
+			return jsonify({'error': 'Insufficient funds'}), 400
+		if e.code == DESTINATION_NOT_FOUND_ERRCODE:
+			return jsonify({'error': 'Destination account not found'}), 400
+		logger.error(f"Transfer failed for user {user['user_id']}: {e}")
+		return jsonify({'error': 'Transfer failed. Please try again.'}), 500
+	except Exception as e:
+		logger.error(f"Transfer failed for user {user['user_id']}: {e}")
+		return jsonify({'error': 'Transfer failed. Please try again.'}), 500
+	
+	transfer = result.data['transfer']
+	new_from_balance = result.data['from_balance']
+	logger.info(f"Transfer created with ID: {transfer['id']}")
+	
+	# Send email notification in the background - the transfer is already
+	# committed, so the client shouldn't wait on the mail provider
 	html = transfer_confirmation_email(
 		amount, 
 		new_from_balance,
@@ -280,14 +233,18 @@ async def create_transfer(user):
 		transfer_type,
 		status
 	)
-	await notify_user(
+	# Preferences and email come from the users row the PIN check already loaded
+	user_row = await get_user_row(user['user_id'])
+	run_in_background(notify_user(
 		supabase,
 		user['user_id'],
 		'transfer',
 		f'Transfer of ${amount:,.2f} to {recipient_name} {status}',
 		'Transfer Confirmation',
-		html
-	)
+		html,
+		prefs=user_row.get('notification_preferences') or {},
+		email=user_row.get('email')
+	))
 	
 	logger.info(f"Transfer {status} for user {user['user_id']}: ${amount:.2f} ({transfer_type}) to {recipient_name}")
-	return jsonify(result.data[0]), 201
+	return jsonify(transfer), 201
@@ -175,17 +175,18 @@ CREATE TABLE IF NOT EXISTS beneficiaries (
 
 -- Create indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_accounts_user_id ON accounts(user_id);
+CREATE INDEX IF NOT EXISTS idx_accounts_id_user_id ON accounts(id, user_id);
 CREATE INDEX IF NOT EXISTS idx_cards_user_id ON cards(user_id);
 CREATE INDEX IF NOT EXISTS idx_transactions_account_id ON transactions(account_id);
 CREATE INDEX IF NOT EXISTS idx_transactions_created_at ON transactions(created_at DESC);
-CREATE INDEX IF NOT EXISTS idx_transfers_user_id ON transfers(user_id);
+CREATE INDEX IF NOT EXISTS idx_transfers_user_id_created_at ON transfers(user_id, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_bills_user_id ON bills(user_id);
 CREATE INDEX IF NOT EXISTS idx_notifications_user_id ON notifications(user_id);
 CREATE INDEX IF NOT EXISTS idx_notifications_created_at ON notifications(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_beneficiaries_user_id ON beneficiaries(user_id);
 CREATE INDEX IF NOT EXISTS idx_card_issue_reports_user_id ON card_issue_reports(user_id);
 CREATE INDEX IF NOT EXISTS idx_card_issue_reports_card_id ON card_issue_reports(card_id);
-CREATE INDEX IF NOT EXISTS idx_card_issue_reports_created_at ON card_issue_reports(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_card_issue_reports_created_at_id ON card_issue_reports(created_at DESC, id DESC);
 
 -- Enable Row Level Security
 ALTER TABLE users ENABLE ROW LEVEL SECURITY;
@@ -7,6 +7,7 @@ Usage Examples:
   python seed.py --email user@example.com --wealth-context wealthy
   python seed.py --email user@example.com --target-balance 34000000
   python seed.py --email user@example.com --wealth-context ultra --months 12
+  python seed.py --email user@example.com --seed 42
 
 Wealth Contexts:
   modest    - $50K default balance, everyday transactions
@@ -18,109 +19,207 @@ Wealth Contexts:
 import argparse
 import random
 import sys
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from faker import Faker
+from postgrest.types import ReturnMethod
 from core import get_supabase_client
 from utils import generate_card_number, generate_account_number, generate_cvv
 
 fake = Faker()
 supabase = get_supabase_client()
 
+# Faker providers are slow per call; seeded names need realism, not uniqueness.
+# Filled by build_fake_pools() once main() has applied any --seed
+COMPANY_POOL: tuple = ()
+IBAN_POOL: tuple = ()
+
+# Rows per insert request; PostgREST accepts a JSON array per call
+INSERT_BATCH_SIZE = 500
+# Most insert chunks in flight at once, kept low to stay under rate limits
+INSERT_MAX_CONCURRENCY = 8
+
+# Transaction merchants and categories, built once at import
+LUXURY_MERCHANTS = (
+	'Cartier Boutique', 'Van Cleef & Arpels', 'Montblanc Store',
+	'Four Seasons Hotel', 'Ritz-Carlton', 'Louis Vuitton',
+	'Hermès Paris', 'Tiffany & Co', 'Bulgari', 'Chopard Genève'
+)
+REGULAR_MERCHANTS = (
+	'Whole Foods Market', 'Starbucks', 'Amazon.com', 'Apple Store',
+	'Netflix', 'Spotify Premium', 'Uber', 'Delta Airlines',
+	'Shell Gas Station', 'CVS Pharmacy', 'AT&T Wireless'
+)
+UTILITY_MERCHANTS = ('Electric Company', 'Water Services', 'Internet Provider')
+LUXURY_CATEGORIES = ('Jewelry', 'Travel', 'Shopping')
+REGULAR_CATEGORIES = ('Dining', 'Shopping', 'Entertainment', 'Groceries')
+
+
+# Notification types with a renderer taking (amount, brand, payee, account_type)
+# and returning (title, message); f-strings skip str.format's per-call parsing
+NOTIFICATION_TEMPLATES = (
+	('transaction', lambda amount, brand, payee, account_type: (
+		f'Large Purchase Alert: ${amount} spent at {brand}',
+		f'A purchase of ${amount} was made on your {brand} card'
+	)),
+	('transfer', lambda amount, brand, payee, account_type: (
+		f'Transfer Completed: ${amount}',
+		f'Transfer of ${amount} has been completed successfully'
+	)),
+	('bill_payment', lambda amount, brand, payee, account_type: (
+		f'Bill Payment Processed: ${payee}',
+		f'Payment to {payee} for ${amount} has been processed'
+	)),
+	('card_approved', lambda amount, brand, payee, account_type: (
+		'Card Application Approved',
+		f'Your {brand} card application has been approved'
+	)),
+	('low_balance', lambda amount, brand, payee, account_type: (
+		'Low Balance Alert',
+		f'Your {account_type} account balance is below ${amount}'
+	)),
+	('login', lambda amount, brand, payee, account_type: (
+		'New Login Detected',
+		'New login to your account from New York, NY'
+	)),
+	('security', lambda amount, brand, payee, account_type: (
+		'Security Alert',
+		'Your password was changed successfully'
+	))
+)
+NOTIFICATION_BRANDS = ('Cartier', 'Van Cleef & Arpels', 'Montblanc')
+NOTIFICATION_PAYEES = ('Electric Company', 'Internet Provider')
+NOTIFICATION_ACCOUNT_TYPES = ('Checking', 'Savings')
+
+
+def build_fake_pools() -> None:
+	"""Build the Faker value pools from Faker's current state"""
+	global COMPANY_POOL, IBAN_POOL
+	COMPANY_POOL = tuple(fake.company() for _ in range(64))
+	IBAN_POOL = tuple(fake.iban() for _ in range(16))
+
+
+def to_cents(amount_range: tuple) -> tuple:
+	"""Convert a (min, max) dollar range to whole cents for random.randint"""
+	return round(amount_range[0] * 100), round(amount_range[1] * 100)
+
+
+def insert_rows(table: str, rows: list, returning: ReturnMethod = ReturnMethod.representation) -> list:
+	"""Insert rows with one request per INSERT_BATCH_SIZE chunk
+	
+	Args:
+		table: Table name
+		rows: Row dicts to insert
+		returning: ReturnMethod.minimal skips echoing the inserted rows back
+	
+	Returns:
+		Inserted rows, in the order given (empty with ReturnMethod.minimal)
+	"""
+	chunks = [rows[start:start + INSERT_BATCH_SIZE] for start in range(0, len(rows), INSERT_BATCH_SIZE)]
+	
+	def insert_chunk(chunk: list) -> list:
+		return supabase.table(table).insert(chunk, returning=returning).execute().data or []
+	
+	if len(chunks) <= 1:
+		return [row for chunk in chunks for row in insert_chunk(chunk)]
+	
+	# Overlap the round trips of large inserts; map() keeps chunk order
+	with ThreadPoolExecutor(max_workers=min(INSERT_MAX_CONCURRENCY, len(chunks))) as executor:
+		return [row for inserted in executor.map(insert_chunk, chunks) for row in inserted]
+
+
+# Default target balance per wealth context, read-only
+DEFAULT_BALANCES = MappingProxyType({
+	'modest': 50000,
+	'standard': 250000,
+	'affluent': 2000000,
+	'wealthy': 10000000,
+	'ultra': 50000000
+})
+
+# Transaction configuration per wealth context, read-only
+WEALTH_CONFIGS = MappingProxyType({
+	'modest': {
+		'account_balance_ranges': {
+			'Checking': (1000, 15000),
+			'Savings': (2000, 30000),
+			'Investment': (5000, 50000)
+		},
+		'salary_range': (3000, 8000),
+		'regular_transaction_range': (5, 200),
+		'luxury_transaction_range': (200, 2000),
+		'utility_range': (50, 200),
+		'transfer_range': (50, 2000),
+		'luxury_frequency': 0.05,
+		'card_limits': {'Credit': 5000, 'Debit': 0}
+	},
+	'standard': {
+		'account_balance_ranges': {
+			'Checking': (1000, 25000),
+			'Savings': (5000, 75000),
+			'Investment': (10000, 150000)
+		},
+		'salary_range': (5000, 15000),
+		'regular_transaction_range': (10, 500),
+		'luxury_transaction_range': (500, 8000),
+		'utility_range': (100, 400),
+		'transfer_range': (100, 5000),
+		'luxury_frequency': 0.15,
+		'card_limits': {'Credit': 25000, 'Debit': 0}
+	},
+	'affluent': {
+		'account_balance_ranges': {
+			'Checking': (5000, 100000),
+			'Savings': (25000, 500000),
+			'Investment': (100000, 2000000)
+		},
+		'salary_range': (15000, 50000),
+		'regular_transaction_range': (25, 1500),
+		'luxury_transaction_range': (2000, 25000),
+		'utility_range': (200, 1000),
+		'transfer_range': (500, 25000),
+		'luxury_frequency': 0.25,
+		'card_limits': {'Credit': 100000, 'Debit': 0}
+	},
+	'wealthy': {
+		'account_balance_ranges': {
+			'Checking': (10000, 500000),
+			'Savings': (100000, 2000000),
+			'Investment': (500000, 10000000)
+		},
+		'salary_range': (25000, 150000),
+		'regular_transaction_range': (50, 5000),
+		'luxury_transaction_range': (5000, 100000),
+		'utility_range': (500, 3000),
+		'transfer_range': (1000, 100000),
+		'luxury_frequency': 0.35,
+		'card_limits': {'Credit': 500000, 'Debit': 0}
+	},
+	'ultra': {
+		'account_balance_ranges': {
+			'Checking': (25000, 2000000),
+			'Savings': (500000, 10000000),
+			'Investment': (2000000, 50000000)
+		},
+		'salary_range': (50000, 500000),
+		'regular_transaction_range': (100, 10000),
+		'luxury_transaction_range': (10000, 1000000),
+		'utility_range': (1000, 10000),
+		'transfer_range': (5000, 1000000),
+		'luxury_frequency': 0.45,
+		'card_limits': {'Credit': 2000000, 'Debit': 0}
+	}
+})
+
 
 class WealthContext:
 	"""Wealth context configuration for realistic transaction generation"""
 	
 	def __init__(self, context_type: str = 'standard', target_balance: float = None):
 		self.context_type = context_type
-		self.target_balance = target_balance or self._get_default_balance(context_type)
-		self.config = self._get_config(context_type)
-	
-	def _get_default_balance(self, context_type: str) -> float:
-		"""Get default target balance for context type"""
-		balances = {
-			'modest': 50000,
-			'standard': 250000,
-			'affluent': 2000000,
-			'wealthy': 10000000,
-			'ultra': 50000000
-		}
-		return balances.get(context_type, 250000)
-	
-	def _get_config(self, context_type: str) -> dict:
-		"""Get transaction configuration based on wealth context"""
-		configs = {
-			'modest': {
-				'account_balance_ranges': {
-					'Checking': (1000, 15000),
-					'Savings': (2000, 30000),
-					'Investment': (5000, 50000)
-				},
-				'salary_range': (3000, 8000),
-				'regular_transaction_range': (5, 200),
-				'luxury_transaction_range': (200, 2000),
-				'utility_range': (50, 200),
-				'transfer_range': (50, 2000),
-				'luxury_frequency': 0.05,
-				'card_limits': {'Credit': 5000, 'Debit': 0}
-			},
-			'standard': {
-				'account_balance_ranges': {
-					'Checking': (1000, 25000),
-					'Savings': (5000, 75000),
-					'Investment': (10000, 150000)
-				},
-				'salary_range': (5000, 15000),
-				'regular_transaction_range': (10, 500),
-				'luxury_transaction_range': (500, 8000),
-				'utility_range': (100, 400),
-				'transfer_range': (100, 5000),
-				'luxury_frequency': 0.15,
-				'card_limits': {'Credit': 25000, 'Debit': 0}
-			},
-			'affluent': {
-				'account_balance_ranges': {
-					'Checking': (5000, 100000),
-					'Savings': (25000, 500000),
-					'Investment': (100000, 2000000)
-				},
-				'salary_range': (15000, 50000),
-				'regular_transaction_range': (25, 1500),
-				'luxury_transaction_range': (2000, 25000),
-				'utility_range': (200, 1000),
-				'transfer_range': (500, 25000),
-				'luxury_frequency': 0.25,
-				'card_limits': {'Credit': 100000, 'Debit': 0}
-			},
-			'wealthy': {
-				'account_balance_ranges': {
-					'Checking': (10000, 500000),
-					'Savings': (100000, 2000000),
-					'Investment': (500000, 10000000)
-				},
-				'salary_range': (25000, 150000),
-				'regular_transaction_range': (50, 5000),
-				'luxury_transaction_range': (5000, 100000),
-				'utility_range': (500, 3000),
-				'transfer_range': (1000, 100000),
-				'luxury_frequency': 0.35,
-				'card_limits': {'Credit': 500000, 'Debit': 0}
-			},
-			'ultra': {
-				'account_balance_ranges': {
-					'Checking': (25000, 2000000),
-					'Savings': (500000, 10000000),
-					'Investment': (2000000, 50000000)
-				},
-				'salary_range': (50000, 500000),
-				'regular_transaction_range': (100, 10000),
-				'luxury_transaction_range': (10000, 1000000),
-				'utility_range': (1000, 10000),
-				'transfer_range': (5000, 1000000),
-				'luxury_frequency': 0.45,
-				'card_limits': {'Credit': 2000000, 'Debit': 0}
-			}
-		}
-		return configs.get(context_type, configs['standard'])
+		self.target_balance = target_balance or DEFAULT_BALANCES.get(context_type, 250000)
+		self.config = WEALTH_CONFIGS.get(context_type, WEALTH_CONFIGS['standard'])
 	
 	def scale_to_target(self, current_total: float) -> float:
 		"""Get scaling factor to reach target balance"""
@@ -154,8 +253,9 @@ def get_or_create_accounts(user_id: str, wealth_context: WealthContext) -> list:
 	# Create new accounts with realistic timing
 	print("No accounts found. Creating new ones...")
 	account_types = ['Checking', 'Savings', 'Investment']
-	accounts = []
-	base_date = datetime.utcnow()
+	account_rows = []
+	created_lines = []
+	base_date = datetime.now(timezone.utc)
 	
 	for i, acc_type in enumerate(account_types):
 		# Stagger account creation: oldest first (Investment), then Savings, then Checking
@@ -184,10 +284,11 @@ def get_or_create_accounts(user_id: str, wealth_context: WealthContext) -> list:
 			'created_at': created_at.isoformat()
 		}
 		
-		result = supabase.table('accounts').insert(account_data).execute()
-		accounts.append(result.data[0])
-		print(f"  Created {acc_type} account (opened {days_ago} days ago): {account_data['account_number']} | Balance: ${target_for_account:,.2f}")
+		account_rows.append(account_data)
+		created_lines.append(f"  Created {acc_type} account (opened {days_ago} days ago): {account_data['account_number']} | Balance: ${target_for_account:,.2f}")
 	
+	accounts = insert_rows('accounts', account_rows)
+	print('\n'.join(created_lines))
 	return accounts
 
 
@@ -209,8 +310,9 @@ def get_or_create_cards(user_id: str, wealth_context: WealthContext) -> list:
 		('Credit', 'Van Cleef & Arpels', wealth_context.config['card_limits']['Credit'] * 0.7, 365),  # 1 year old
 		('Debit', 'Montblanc', 0, 90)  # Newest, 3 months old
 	]
-	cards = []
-	base_date = datetime.utcnow()
+	card_rows = []
+	created_lines = []
+	base_date = datetime.now(timezone.utc)
 	
 	for card_type, brand, limit, days_ago in card_configs:
 		created_at = base_date - timedelta(days=days_ago)
@@ -223,15 +325,16 @@ def get_or_create_cards(user_id: str, wealth_context: WealthContext) -> list:
 			'cvv': generate_cvv(),
 			'expiry_date': (base_date + timedelta(days=1095)).strftime('%m/%y'),  # 3 years from now
 			'credit_limit': limit,
-			'balance': round(random.uniform(0, limit * 0.3), 2) if card_type == 'Credit' else 0,
+			'balance': random.randint(*to_cents((0, limit * 0.3))) / 100 if card_type == 'Credit' else 0,
 			'status': 'active',
 			'created_at': created_at.isoformat()
 		}
 		
-		result = supabase.table('cards').insert(card_data).execute()
-		cards.append(result.data[0])
-		print(f"  Created {brand} {card_type} (issued {days_ago} days ago): ****{card_data['card_number'][-4:]}")
+		card_rows.append(card_data)
+		created_lines.append(f"  Created {brand} {card_type} (issued {days_ago} days ago): ****{card_data['card_number'][-4:]}")
 	
+	cards = insert_rows('cards', card_rows)
+	print('\n'.join(created_lines))
 	return cards
 
 
@@ -242,101 +345,93 @@ def seed_realistic_transactions(accounts: list, months: int, wealth_context: Wea
 	salary deposits, realistic spending patterns.
 	Applies scale_factor to all transaction amounts to match target balance.
 	"""
-	luxury_merchants = [
-		'Cartier Boutique', 'Van Cleef & Arpels', 'Montblanc Store',
-		'Four Seasons Hotel', 'Ritz-Carlton', 'Louis Vuitton',
-		'Hermès Paris', 'Tiffany & Co', 'Bulgari', 'Chopard Genève'
-	]
-	
-	regular_merchants = [
-		'Whole Foods Market', 'Starbucks', 'Amazon.com', 'Apple Store',
-		'Netflix', 'Spotify Premium', 'Uber', 'Delta Airlines',
-		'Shell Gas Station', 'CVS Pharmacy', 'AT&T Wireless'
-	]
-	
-	utilities = ['Electric Company', 'Water Services', 'Internet Provider']
-	
-	base_date = datetime.utcnow()
-	start_date = base_date - timedelta(days=months * 30)
-	total_tx = 0
+	base_date = datetime.now(timezone.utc)
+	# Ages are whole days, so format each possible timestamp once and index it
+	created_at_by_days_ago = [(base_date - timedelta(days=d)).isoformat() for d in range(months * 30 + 1)]
+	transaction_rows = []
+	
+	# Scale the context's ranges once rather than on every row; amounts are
+	# drawn as whole cents, so no per-row round() is needed
+	config = wealth_context.config
+	salary_cents = to_cents(wealth_context.get_scaled_range(config['salary_range'], scale_factor))
+	transfer_cents = to_cents(wealth_context.get_scaled_range(config['transfer_range'], scale_factor))
+	utility_cents = to_cents(wealth_context.get_scaled_range(config['utility_range'], scale_factor))
+	luxury_cents = to_cents(wealth_context.get_scaled_range(config['luxury_transaction_range'], scale_factor))
+	regular_cents = to_cents(wealth_context.get_scaled_range(config['regular_transaction_range'], scale_factor))
+	luxury_frequency = config['luxury_frequency']
 	
 	print(f"Generating {months} months of transaction history...")
 	
 	for account in accounts:
+		account_id = account['id']
 		acc_type = account['account_type']
+		is_checking = acc_type == 'Checking'
 		
 		# More transactions for checking accounts
-		num_tx = random.randint(40, 150) if acc_type == 'Checking' else random.randint(10, 40)
+		num_tx = random.randint(40, 150) if is_checking else random.randint(10, 40)
 		
-		for _ in range(num_tx):
-			# More recent transactions are more common (realistic behavior)
-			days_ago = int(random.triangular(0, months * 30, 0))
-			tx_date = base_date - timedelta(days=days_ago)
-			
-			# Determine transaction type and merchant
-			tx_type = random.choices(['debit', 'credit'], weights=[0.7, 0.3])[0]
-			
+		# Draw the account's transaction types and ages up front: one weighted
+		# random.choices call samples every type instead of one call per row.
+		# More recent transactions are more common (realistic behavior)
+		tx_types = random.choices(('debit', 'credit'), weights=(0.7, 0.3), k=num_tx)
+		days_ago_draws = [int(random.triangular(0, months * 30, 0)) for _ in range(num_tx)]
+		
+		for tx_type, days_ago in zip(tx_types, days_ago_draws):
+			# Determine merchant from the transaction type
 			if tx_type == 'credit':
 				# Credits: salary, transfers, refunds
-				if random.random() < 0.6 and acc_type == 'Checking':
+				if random.random() < 0.6 and is_checking:
 					merchant = 'Salary Deposit'
-					description = f'Monthly salary deposit - {fake.company()}'
-					salary_range = wealth_context.get_scaled_range(wealth_context.config['salary_range'], scale_factor)
-					amount = round(random.uniform(*salary_range), 2)
+					description = f'Monthly salary deposit - {random.choice(COMPANY_POOL)}'
+					amount = random.randint(*salary_cents) / 100
 					category = 'Income'
 				else:
 					merchant = 'Transfer In'
-					description = f'Funds transfer from {fake.company()}'
-					transfer_range = wealth_context.get_scaled_range(wealth_context.config['transfer_range'], scale_factor)
-					amount = round(random.uniform(*transfer_range), 2)
+					description = f'Funds transfer from {random.choice(COMPANY_POOL)}'
+					amount = random.randint(*transfer_cents) / 100
 					category = 'Transfer'
 			else:
 				# Debits: spending
-				is_luxury = random.random() < wealth_context.config['luxury_frequency']
+				is_luxury = random.random() < luxury_frequency
 				is_utility = random.random() < 0.1
 				
 				if is_utility:
-					merchant = random.choice(utilities)
+					merchant = random.choice(UTILITY_MERCHANTS)
 					description = f'Utility payment - {merchant}'
-					utility_range = wealth_context.get_scaled_range(wealth_context.config['utility_range'], scale_factor)
-					amount = round(random.uniform(*utility_range), 2)
+					amount = random.randint(*utility_cents) / 100
 					category = 'Utilities'
 				elif is_luxury:
-					merchant = random.choice(luxury_merchants)
+					merchant = random.choice(LUXURY_MERCHANTS)
 					description = f'Purchase at {merchant}'
-					luxury_range = wealth_context.get_scaled_range(wealth_context.config['luxury_transaction_range'], scale_factor)
-					amount = round(random.uniform(*luxury_range), 2)
-					category = random.choice(['Jewelry', 'Travel', 'Shopping'])
+					amount = random.randint(*luxury_cents) / 100
+					category = random.choice(LUXURY_CATEGORIES)
 				else:
-					merchant = random.choice(regular_merchants)
+					merchant = random.choice(REGULAR_MERCHANTS)
 					description = f'Purchase at {merchant}'
-					regular_range = wealth_context.get_scaled_range(wealth_context.config['regular_transaction_range'], scale_factor)
-					amount = round(random.uniform(*regular_range), 2)
-					category = random.choice(['Dining', 'Shopping', 'Entertainment', 'Groceries'])
+					amount = random.randint(*regular_cents) / 100
+					category = random.choice(REGULAR_CATEGORIES)
 			
-			transaction_data = {
-				'account_id': account['id'],
+			transaction_rows.append({
+				'account_id': account_id,
 				'type': tx_type,
 				'amount': amount,
 				'description': description,
 				'merchant': merchant,
 				'category': category,
-				'created_at': tx_date.isoformat()
-			}
-			
-			supabase.table('transactions').insert(transaction_data).execute()
-			total_tx += 1
+				'created_at': created_at_by_days_ago[days_ago]
+			})
 	
-	print(f"  Created {total_tx} realistic transactions")
+	insert_rows('transactions', transaction_rows, returning=ReturnMethod.minimal)
+	print(f"  Created {len(transaction_rows)} realistic transactions")
 
 
 def seed_bills(user_id: str) -> None:
 	"""Create bill payees with FAILSAFE"""
 	# Check existing
-	existing = supabase.table('bills').select('*').eq('user_id', user_id).execute()
+	existing = supabase.table('bills').select('id', count='exact', head=True).eq('user_id', user_id).execute()
 	
-	if existing.data and len(existing.data) > 0:
-		print(f"Found {len(existing.data)} existing bill payees")
+	if existing.count:
+		print(f"Found {existing.count} existing bill payees")
 		return
 	
 	print("No bills found. Creating payees...")
@@ -349,119 +444,109 @@ def seed_bills(user_id: str) -> None:
 		('State Farm Insurance', 'insurance')
 	]
 	
+	now = datetime.now(timezone.utc)
+	bill_rows = []
 	for payee_name, bill_type in bill_types:
-		bill_data = {
+		bill_rows.append({
 			'user_id': user_id,
 			'payee_name': payee_name,
-			'account_number': fake.iban(),
+			'account_number': random.choice(IBAN_POOL),
 			'bill_type': bill_type,
-			'amount': round(random.uniform(50, 500), 2),  # Realistic bill amounts
-			'due_date': (datetime.utcnow() + timedelta(days=random.randint(1, 30))).date().isoformat(),  # Due within next 30 days
+			'amount': random.randint(5000, 50000) / 100,  # Realistic bill amounts
+			'due_date': (now + timedelta(days=random.randint(1, 30))).date().isoformat(),  # Due within next 30 days
 			'auto_pay': bill_type == 'utility',  # Auto-pay utilities by default
-			'created_at': (datetime.utcnow() - timedelta(days=random.randint(90, 365))).isoformat()
-		}
-		
-		supabase.table('bills').insert(bill_data).execute()
+			'created_at': (now - timedelta(days=random.randint(90, 365))).isoformat()
+		})
 	
+	insert_rows('bills', bill_rows, returning=ReturnMethod.minimal)
 	print(f"  Created {len(bill_types)} bill payees")
 
 
 def seed_checks(user_id: str, accounts: list, wealth_context: WealthContext, scale_factor: float = 1.0) -> None:
 	"""Create check records with FAILSAFE"""
 	# Check existing
-	existing = supabase.table('checks').select('*').eq('user_id', user_id).execute()
+	existing = supabase.table('checks').select('id', count='exact', head=True).eq('user_id', user_id).execute()
 	
-	if existing.data and len(existing.data) > 0:
-		print(f"Found {len(existing.data)} existing checks")
+	if existing.count:
+		print(f"Found {existing.count} existing checks")
 		return
 	
 	print("No checks found. Creating history...")
 	num_checks = random.randint(8, 20)
+	now = datetime.now(timezone.utc)
+	check_rows = []
+	
+	# Scale check amounts based on wealth context and target balance
+	check_cents = to_cents(wealth_context.get_scaled_range(wealth_context.config['transfer_range'], scale_factor))
 	
-	for i in range(num_checks):
+	# Sample every check's source account in one call
+	check_accounts = random.choices(accounts, k=num_checks)
+	
+	for i, account in enumerate(check_accounts):
 		# Most recent checks should be cleared, older ones can be pending
 		days_ago = random.randint(5, 180)
 		status = 'cleared' if days_ago > 7 else random.choice(['cleared', 'pending'])
 		
-		# Scale check amounts based on wealth context and target balance
-		check_range = wealth_context.get_scaled_range(wealth_context.config['transfer_range'], scale_factor)
-		
-		check_data = {
+		check_rows.append({
 			'user_id': user_id,
-			'account_id': random.choice(accounts)['id'],
-			'amount': round(random.uniform(*check_range), 2),
+			'account_id': account['id'],
+			'amount': random.randint(*check_cents) / 100,
 			'check_number': str(1001 + i),
-			'payee': fake.company(),
+			'payee': random.choice(COMPANY_POOL),
 			'status': status,
-			'created_at': (datetime.utcnow() - timedelta(days=days_ago)).isoformat()
-		}
-		
-		supabase.table('checks').insert(check_data).execute()
+			'created_at': (now - timedelta(days=days_ago)).isoformat()
+		})
 	
+	insert_rows('checks', check_rows, returning=ReturnMethod.minimal)
 	print(f"  Created {num_checks} check records")
 
 
 def seed_notifications(user_id: str, months: int, wealth_context: WealthContext, scale_factor: float = 1.0) -> None:
 	"""Create notification history with FAILSAFE"""
 	# Check existing
-	existing = supabase.table('notifications').select('*').eq('user_id', user_id).execute()
+	existing = supabase.table('notifications').select('id', count='exact', head=True).eq('user_id', user_id).execute()
 	
-	if existing.data and len(existing.data) > 0:
-		print(f"Found {len(existing.data)} existing notifications")
+	if existing.count:
+		print(f"Found {existing.count} existing notifications")
 		return
 	
 	print("No notifications found. Creating history...")
 	
-	notification_templates = [
-		('transaction', 'Large Purchase Alert: ${amount} spent at {brand}', 'A purchase of ${amount} was made on your {brand} card'),
-		('transfer', 'Transfer Completed: ${amount}', 'Transfer of ${amount} has been completed successfully'),
-		('bill_payment', 'Bill Payment Processed: ${payee}', 'Payment to {payee} for ${amount} has been processed'),
-		('card_approved', 'Card Application Approved', 'Your {brand} card application has been approved'),
-		('low_balance', 'Low Balance Alert', 'Your {account_type} account balance is below ${amount}'),
-		('login', 'New Login Detected', 'New login to your account from {location}'),
-		('security', 'Security Alert', 'Your password was changed successfully')
-	]
-	
-	start_date = datetime.utcnow() - timedelta(days=months * 30)
+	start_date = datetime.now(timezone.utc) - timedelta(days=months * 30)
+	created_at_by_day = [(start_date + timedelta(days=d)).isoformat() for d in range(months * 30 + 1)]
 	num_notifications = random.randint(15, 40)
-	
-	for _ in range(num_notifications):
-		notif_type, title_template, message_template = random.choice(notification_templates)
-		
-		# Make messages more realistic based on wealth context and target balance
-		luxury_range = wealth_context.get_scaled_range(wealth_context.config['luxury_transaction_range'], scale_factor)
-		regular_range = wealth_context.get_scaled_range(wealth_context.config['regular_transaction_range'], scale_factor)
-		max_notification_amount = int(luxury_range[1] * 0.8)
-		min_notification_amount = int(regular_range[1])
-		
-		message = message_template.format(
-			amount=random.randint(min_notification_amount, max_notification_amount),
-			brand=random.choice(['Cartier', 'Van Cleef & Arpels', 'Montblanc']),
-			payee=random.choice(['Electric Company', 'Internet Provider']),
-			account_type=random.choice(['Checking', 'Savings']),
-			location='New York, NY'
-		)
-		
-		title = title_template.format(
-			amount=random.randint(min_notification_amount, max_notification_amount),
-			brand=random.choice(['Cartier', 'Van Cleef & Arpels', 'Montblanc']),
-			payee=random.choice(['Electric Company', 'Internet Provider']),
-			account_type=random.choice(['Checking', 'Savings']),
-			location='New York, NY'
+	notification_rows = []
+	
+	# Make messages more realistic based on wealth context and target balance
+	luxury_range = wealth_context.get_scaled_range(wealth_context.config['luxury_transaction_range'], scale_factor)
+	regular_range = wealth_context.get_scaled_range(wealth_context.config['regular_transaction_range'], scale_factor)
+	max_notification_amount = int(luxury_range[1] * 0.8)
+	min_notification_amount = int(regular_range[1])
+	
+	# Sample every notification's template and read flag in one call each
+	picked_templates = random.choices(NOTIFICATION_TEMPLATES, k=num_notifications)
+	read_flags = random.choices((True, False), k=num_notifications)
+	
+	for (notif_type, render), is_read in zip(picked_templates, read_flags):
+		# Title and message share one draw, so they describe the same event
+		title, message = render(
+			random.randint(min_notification_amount, max_notification_amount),
+			random.choice(NOTIFICATION_BRANDS),
+			random.choice(NOTIFICATION_PAYEES),
+			random.choice(NOTIFICATION_ACCOUNT_TYPES)
 		)
 		
-		notification_data = {
+		notification_rows.append({
 			'user_id': user_id,
 			'type': notif_type,
 			'title': title,
 			'message': message,
 			'delivery_method': 'push',  # Default to push notifications
-			'read': random.choice([True, False]),
-			'created_at': (start_date + timedelta(days=random.randint(0, months * 30))).isoformat()
-		}
-		
-		supabase.table('notifications').insert(notification_data).execute()
+			'read': is_read,
+			'created_at': created_at_by_day[random.randint(0, months * 30)]
+		})
 	
+	insert_rows('notifications', notification_rows, returning=ReturnMethod.minimal)
 	print(f"  Created {num_notifications} notifications")
 
 
@@ -528,6 +613,7 @@ def main():
 					   default='standard', help='Wealth context for transaction magnitudes')
 	parser.add_argument('--target-balance', type=float, help='Target total balance (overrides wealth-context default)')
 	parser.add_argument('--overwrite', action='store_true', help='Delete all existing data for the user before seeding (no prompt)')
+	parser.add_argument('--seed', type=int, help='Random seed for reproducible generated data')
 
 	args = parser.parse_args()
 	
@@ -566,11 +652,17 @@ def main():
 		print("ERROR: Target balance must be greater than 0")
 		sys.exit(1)
 	
+	# Seed both generators before any data (including the Faker pools) is drawn
+	if args.seed is not None:
+		random.seed(args.seed)
+		fake.seed_instance(args.seed)
+	build_fake_pools()
+	
 	# Show wealth context info
 	if args.target_balance:
 		print(f"Custom target balance: ${args.target_balance:,.2f}")
 	else:
-		default_balance = WealthContext(args.wealth_context)._get_default_balance(args.wealth_context)
+		default_balance = DEFAULT_BALANCES[args.wealth_context]
 		print(f"Wealth context '{args.wealth_context}' with default target: ${default_balance:,.2f}")
 	
 	print(f"\n{'='*60}")
@@ -617,7 +709,7 @@ def main():
 		# Initialize wealth context
 		wealth_context = WealthContext(args.wealth_context, args.target_balance)
 		print(f"Context Configuration: {wealth_context.context_type}")
-		print(f"Expected Range: ${wealth_context._get_default_balance(args.wealth_context):,.2f} default balance")
+		print(f"Expected Range: ${DEFAULT_BALANCES[args.wealth_context]:,.2f} default balance")
 		print()
 		
 		# Calculate scaling factor to reach target balance
@@ -625,10 +717,12 @@ def main():
 		scale_factor = wealth_context.scale_to_target(estimated_total)
 		
 		# Overwrite / append decision
-		has_existing = any([
-			supabase.table('accounts').select('id').eq('user_id', user_id).limit(1).execute().data,
-			supabase.table('cards').select('id').eq('user_id', user_id).limit(1).execute().data,
-		])
+		# Independent read-only checks, so run them side by side
+		with ThreadPoolExecutor(max_workers=2) as executor:
+			has_existing = any(executor.map(
+				lambda table: supabase.table(table).select('id').eq('user_id', user_id).limit(1).execute().data,
+				('accounts', 'cards')
+			))
 
 		if has_existing:
 			if args.overwrite:
@@ -652,12 +746,28 @@ def main():
 				purge_existing_data(user_id)
 
 		# Seed with failsafes
-		accounts = get_or_create_accounts(user_id, wealth_context)
-		cards = get_or_create_cards(user_id, wealth_context)
-		seed_realistic_transactions(accounts, args.months, wealth_context, scale_factor)
-		seed_bills(user_id)
-		seed_checks(user_id, accounts, wealth_context, scale_factor)
-		seed_notifications(user_id, args.months, wealth_context, scale_factor)
+		# A seeded run uses one worker so the seeders draw in a fixed order
+		seed_workers = 1 if args.seed is not None else 4
+		
+		# Accounts and cards don't reference each other, so their existence
+		# checks and inserts overlap
+		with ThreadPoolExecutor(max_workers=min(seed_workers, 2)) as executor:
+			accounts_future = executor.submit(get_or_create_accounts, user_id, wealth_context)
+			cards_future = executor.submit(get_or_create_cards, user_id, wealth_context)
+			accounts = accounts_future.result()
+			cards_future.result()
+		
+		# The remaining seeders write to separate tables and are bound by
+		# Supabase latency, so run them side by side
+		with ThreadPoolExecutor(max_workers=seed_workers) as executor:
+			futures = [
+				executor.submit(seed_realistic_transactions, accounts, args.months, wealth_context, scale_factor),
+				executor.submit(seed_bills, user_id),
+				executor.submit(seed_checks, user_id, accounts, wealth_context, scale_factor),
+				executor.submit(seed_notifications, user_id, args.months, wealth_context, scale_factor)
+			]
+			for future in futures:
+				future.result()  # Re-raise any seeder failure
 		
 		print(f"\n{'='*60}")
 		print("✅ SEEDING COMPLETE")
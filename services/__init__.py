@@ -2,14 +2,22 @@
 Service functions package
 """
 from .email_service import send_email
-from .notification_service import log_notification
-from .user_service import get_user_email, get_user_profile
-from .notification_helper import notify_user
+from .notification_service import log_notification, flush_notifications
+from .user_service import get_user_email, get_user_profile, invalidate_user_profile, get_admin_ids, invalidate_admin_ids
+from .notification_helper import notify_user, notify_admins
+from .background import run_in_background, drain_background_tasks
 
 __all__ = [
 	'send_email',
 	'log_notification',
+	'flush_notifications',
 	'get_user_email',
 	'get_user_profile',
-	'notify_user'
+	'invalidate_user_profile',
+	'get_admin_ids',
+	'invalidate_admin_ids',
+	'notify_user',
+	'notify_admins',
+	'run_in_background',
+	'drain_background_tasks'
 ]
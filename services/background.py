@@ -0,0 +1,63 @@
+"""
+Fire-and-forget background tasks for work that must not delay a response
+(e.g. confirmation emails and notification logs)
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Coroutine, List, Set
+
+logger = logging.getLogger(__name__)
+
+# Strong references to in-flight tasks - the event loop only keeps weak ones,
+# so an unreferenced task could be garbage-collected before it finishes
+_background_tasks: Set[asyncio.Task] = set()
+
+# Coroutine functions run when draining, before waiting on the tasks (e.g. to
+# flush buffered writes that would otherwise be lost on shutdown)
+_drain_hooks: List[Callable[[], Awaitable[None]]] = []
+
+
+def _on_task_done(task: asyncio.Task) -> None:
+	_background_tasks.discard(task)
+	if not task.cancelled() and task.exception() is not None:
+		logger.error(f"Background task {task.get_name()} failed: {task.exception()}")
+
+
+def run_in_background(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+	"""Schedule a coroutine to run after the current handler returns
+	
+	Args:
+		coro: Coroutine to run
+	
+	Returns:
+		The scheduled task
+	"""
+	task = asyncio.create_task(coro)
+	_background_tasks.add(task)
+	task.add_done_callback(_on_task_done)
+	return task
+
+
+def register_drain_hook(hook: Callable[[], Awaitable[None]]) -> None:
+	"""Run a coroutine function whenever background tasks are drained
+	
+	Args:
+		hook: Coroutine function taking no arguments
+	"""
+	_drain_hooks.append(hook)
+
+
+async def drain_background_tasks() -> None:
+	"""Wait for all pending background tasks (call on app shutdown)
+	
+	Runs the registered drain hooks first. Tasks may schedule further
+	background work (e.g. a notification flush timer), so keep waiting until
+	no tasks remain.
+	"""
+	for hook in _drain_hooks:
+		try:
+			await hook()
+		except Exception as e:
+			logger.error(f"Drain hook {hook.__name__} failed: {e}")
+	while _background_tasks:
+		await asyncio.gather(*list(_background_tasks), return_exceptions=True)
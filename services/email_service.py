@@ -1,15 +1,34 @@
 """
 Email service using Resend API
 """
+import asyncio
 import logging
+from functools import cache
+from types import ModuleType
 from typing import Optional, List, Dict, Any
-import resend
 from core.config import EMAIL_FROM, RESEND_API_KEY
 
 logger = logging.getLogger(__name__)
 
-# Initialize Resend
-resend.api_key = RESEND_API_KEY
+# Max Resend API calls in flight per process - fan-outs (admin alerts,
+# concierge requests) queue here instead of opening unbounded connections
+EMAIL_SEND_CONCURRENCY = 20
+_email_semaphore = asyncio.Semaphore(EMAIL_SEND_CONCURRENCY)
+
+
+@cache
+def _get_resend() -> ModuleType:
+	"""Import and configure the Resend SDK on first use
+	
+	Deferred so worker start-up doesn't pay for importing resend (and its
+	HTTP stack) until an email is actually sent.
+	
+	Returns:
+		The configured resend module
+	"""
+	import resend
+	resend.api_key = RESEND_API_KEY
+	return resend
 
 
 async def send_email(to: str, subject: str, html: str, attachments: Optional[List] = None) -> Dict[str, Any]:
@@ -35,9 +54,11 @@ async def send_email(to: str, subject: str, html: str, attachments: Optional[Lis
 		if attachments:
 			params['attachments'] = attachments
 		
-		response = resend.Emails.send(params)
-		logger.info(f"Email sent successfully to {to}: {response.get('id')}")
+		# resend's client is synchronous - run it (and the first-use import) off the event loop
+		async with _email_semaphore:
+			response = await asyncio.to_thread(lambda: _get_resend().Emails.send(params))
+		logger.info("Email sent successfully to %s: %s", to, response.get('id'))
 		return {'success': True, 'id': response.get('id')}
 	except Exception as e:
-		logger.error(f"Failed to send email to {to}: {str(e)}")
+		logger.error("Failed to send email to %s: %s", to, e)
 		return {'success': False, 'error': str(e)}
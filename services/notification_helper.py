@@ -2,15 +2,50 @@
 Combined notification and email service
 Reduces code duplication - DRY principle
 """
+import asyncio
 import logging
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Dict, Optional
 from supabase import Client
+from core import execute_async
+from .background import run_in_background
 from .email_service import send_email
 from .notification_service import log_notification
-from .user_service import get_user_email
+from .user_service import get_user_email, get_user_profile
 
 logger = logging.getLogger(__name__)
 
+# Default preferences - applied for any key the user hasn't set
+DEFAULT_NOTIFICATION_PREFS = MappingProxyType({
+	'email_transactions': True,
+	'email_bills': True,
+	'email_security': True,
+	'email_marketing': False,
+	'sms_transactions': False,
+	'sms_security': True,
+	'push_transactions': True,
+	'push_bills': True,
+})
+
+# Preference that gates the email for each notification type
+EMAIL_PREF_BY_NOTIFICATION_TYPE = MappingProxyType({
+	'transaction': 'email_transactions',
+	'transfer': 'email_transactions',
+	'account_created': 'email_transactions',
+	'bill_payment': 'email_bills',
+	'bill_due': 'email_bills',
+	'security': 'email_security',
+	'login_alert': 'email_security',
+	'card_issue_reported': 'email_security',
+	'password_changed': 'email_security',
+})
+
+
+def _email_allowed(prefs: Dict[str, Any], notification_type: str) -> bool:
+	"""Whether prefs allow an email for notification_type (unmapped types email by default)"""
+	pref_key = EMAIL_PREF_BY_NOTIFICATION_TYPE.get(notification_type)
+	return prefs.get(pref_key, DEFAULT_NOTIFICATION_PREFS[pref_key]) if pref_key else True
+
 
 async def notify_user(
 	supabase: Client,
@@ -18,7 +53,9 @@ async def notify_user(
 	notification_type: str,
 	notification_message: str,
 	email_subject: Optional[str] = None,
-	email_html: Optional[str] = None
+	email_html: Optional[str] = None,
+	prefs: Optional[Dict[str, Any]] = None,
+	email: Optional[str] = None
 ) -> None:
 	"""Send email and log notification in one call, respecting user preferences
 	
@@ -29,46 +66,84 @@ async def notify_user(
 		notification_message: Notification message for DB
 		email_subject: Optional email subject
 		email_html: Optional email HTML content
+		prefs: The user's notification_preferences, if the caller already
+			loaded their users row; fetched when omitted
+		email: The user's email address from the same row; fetched when omitted
 	"""
-	# Get user notification preferences
-	user_response = supabase.table('users').select('notification_preferences').eq('id', user_id).single().execute()
-	user_prefs = user_response.data.get('notification_preferences', {}) if user_response.data else {}
+	if prefs is not None:
+		user_prefs = prefs
+	else:
+		# Get user notification preferences and email from the cached
+		# profile, which is invalidated whenever the preferences are updated
+		profile = await get_user_profile(supabase, user_id) or {}
+		user_prefs = profile.get('notification_preferences') or {}
+		email = email or profile.get('email')
 	
-	# Default preferences - all enabled if not set
-	default_prefs = {
-		'email_transactions': True,
-		'email_bills': True,
-		'email_security': True,
-		'email_marketing': False,
-		'sms_transactions': False,
-		'sms_security': True,
-		'push_transactions': True,
-		'push_bills': True,
-	}
+	# Check if email should be sent based on notification type
+	should_send_email = _email_allowed(user_prefs, notification_type)
 	
-	# Merge user prefs with defaults
-	prefs = {**default_prefs, **user_prefs}
+	async def email_user() -> None:
+		address = email or await get_user_email(supabase, user_id)
+		if address:
+			await send_email(address, email_subject, email_html)
+			logger.debug("Email sent to %s: %s", user_id, email_subject)
+		else:
+			logger.warning("Could not send email to %s: no email address found", user_id)
 	
-	# Check if email should be sent based on notification type
-	should_send_email = False
-	if notification_type in ['transaction', 'transfer', 'account_created']:
-		should_send_email = prefs.get('email_transactions', True)
-	elif notification_type in ['bill_payment', 'bill_due']:
-		should_send_email = prefs.get('email_bills', True)
-	elif notification_type in ['security', 'login_alert', 'card_issue_reported', 'password_changed']:
-		should_send_email = prefs.get('email_security', True)
+	# Always log notification to database (for in-app notifications), and
+	# send the email alongside it only if user preferences allow it and
+	# email content provided
+	if should_send_email and email_subject and email_html:
+		await asyncio.gather(
+			log_notification(supabase, user_id, notification_type, notification_message),
+			email_user()
+		)
 	else:
-		# For other types, send email by default unless specifically disabled
-		should_send_email = True
+		await log_notification(supabase, user_id, notification_type, notification_message)
+
+
+async def notify_admins(
+	supabase: Client,
+	notification_type: str,
+	notification_message: str,
+	email_subject: Optional[str] = None,
+	email_html: Optional[str] = None
+) -> None:
+	"""Log a notification for every admin in one round-trip, then email them
 	
-	# Always log notification to database (for in-app notifications)
-	await log_notification(supabase, user_id, notification_type, notification_message)
+	Uses the broadcast_admin_notification RPC, which inserts all admin
+	notification rows server-side and returns the admin ids, emails and
+	notification preferences. The emails are sent in the background, to the
+	admins whose preferences allow them.
 	
-	# Send email only if user preferences allow it and email content provided
-	if should_send_email and email_subject and email_html:
-		email = await get_user_email(supabase, user_id)
-		if email:
-			await send_email(email, email_subject, email_html)
-			logger.debug(f"Email sent to {user_id}: {email_subject}")
+	Args:
+		supabase: Supabase client authenticated with the service-role key
+		notification_type: Type of notification (e.g., 'admin_card_issue_alert')
+		notification_message: Notification message for DB
+		email_subject: Optional email subject
+		email_html: Optional email HTML content
+	"""
+	try:
+		result = await execute_async(supabase.rpc('broadcast_admin_notification', {
+			'ntype': notification_type,
+			'message': notification_message
+		}))
+	except Exception as e:
+		logger.error("Failed to broadcast admin notification %s: %s", notification_type, e)
+		return
+	
+	if not (email_subject and email_html):
+		return
+	
+	async def email_admin(admin: dict) -> None:
+		if admin.get('email'):
+			await send_email(admin['email'], email_subject, email_html)
+			logger.debug("Email sent to admin %s: %s", admin['user_id'], email_subject)
 		else:
-			logger.warning(f"Could not send email to {user_id}: no email address found")
+			logger.warning("Could not send email to admin %s: no email address found", admin['user_id'])
+	
+	# The request shouldn't wait on the mail provider, and send_email caps
+	# concurrent sends, so the fan-out is bounded
+	for admin in result.data or []:
+		if _email_allowed(admin.get('notification_preferences') or {}, notification_type):
+			run_in_background(email_admin(admin))
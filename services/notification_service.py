@@ -1,12 +1,68 @@
 """
 Notification logging service
 """
+import asyncio
 import logging
-from datetime import datetime
+from typing import Any, Dict, List, Optional
 from supabase import Client
+from core import execute_async
+from .background import run_in_background, register_drain_hook
 
 logger = logging.getLogger(__name__)
 
+# Notification rows are buffered and written with one multi-row insert, either
+# once the buffer is full or shortly after its first row arrives
+NOTIFICATION_FLUSH_SIZE = 64
+NOTIFICATION_FLUSH_INTERVAL_SECONDS = 0.1
+
+_pending_notifications: List[Dict[str, Any]] = []
+_flush_timer: Optional[asyncio.Task] = None
+# Client the buffered rows are written with when flushed on shutdown
+_flush_client: Optional[Client] = None
+
+
+async def flush_notifications(supabase: Client) -> None:
+	"""Insert all buffered notification rows in one request
+
+	Args:
+		supabase: Supabase client instance
+	"""
+	global _pending_notifications
+	rows, _pending_notifications = _pending_notifications, []
+	if not rows:
+		return
+
+	try:
+		await execute_async(supabase.table('notifications').insert(rows))
+		logger.info("Logged %d notification(s)", len(rows))
+		return
+	except Exception as e:
+		if len(rows) == 1:
+			logger.error("Failed to log notification for user %s: %s", rows[0]['user_id'], e)
+			return
+		logger.warning("Batch insert of %d notification(s) failed, retrying individually: %s", len(rows), e)
+
+	# One bad row fails the whole multi-row insert, so insert the rows one by
+	# one to keep the rest of the batch
+	for row in rows:
+		try:
+			await execute_async(supabase.table('notifications').insert(row))
+		except Exception as e:
+			logger.error("Failed to log notification for user %s: %s", row['user_id'], e)
+
+
+async def _flush_after_interval(supabase: Client) -> None:
+	await asyncio.sleep(NOTIFICATION_FLUSH_INTERVAL_SECONDS)
+	await flush_notifications(supabase)
+
+
+async def _flush_on_drain() -> None:
+	if _flush_client is not None:
+		await flush_notifications(_flush_client)
+
+
+register_drain_hook(_flush_on_drain)
+
 
 async def log_notification(
 	supabase: Client,
@@ -16,7 +72,12 @@ async def log_notification(
 	delivery_method: str = 'email'
 ) -> None:
 	"""Log notification to database
-	
+
+	The row is buffered and written within NOTIFICATION_FLUSH_INTERVAL_SECONDS,
+	batched with any other notifications logged meanwhile, so a read right
+	after this returns may not see it yet. Pending rows are flushed when
+	background tasks are drained on shutdown.
+
 	Args:
 		supabase: Supabase client instance
 		user_id: User's unique identifier
@@ -24,14 +85,18 @@ async def log_notification(
 		message: Notification message
 		delivery_method: Delivery method (default 'email')
 	"""
-	try:
-		supabase.table('notifications').insert({
-			'user_id': user_id,
-			'type': notification_type,
-			'message': message,
-			'delivery_method': delivery_method,
-			'created_at': datetime.utcnow().isoformat()
-		}).execute()
-		logger.info(f"Notification logged for user {user_id}: {notification_type}")
-	except Exception as e:
-		logger.error(f"Failed to log notification for user {user_id}: {str(e)}")
+	global _flush_timer, _flush_client
+	_flush_client = supabase
+	_pending_notifications.append({
+		'user_id': user_id,
+		'type': notification_type,
+		'message': message,
+		'delivery_method': delivery_method
+		# created_at is filled in by the column's DEFAULT NOW()
+	})
+	logger.debug("Notification queued for user %s: %s", user_id, notification_type)
+
+	if len(_pending_notifications) >= NOTIFICATION_FLUSH_SIZE:
+		await flush_notifications(supabase)
+	elif _flush_timer is None or _flush_timer.done():
+		_flush_timer = run_in_background(_flush_after_interval(supabase))
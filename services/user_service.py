@@ -2,14 +2,29 @@
 User-related services
 """
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from supabase import Client
+from core import execute_async
+from utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Admin membership changes rarely - cache the id list for 5 minutes
+ADMIN_IDS_TTL_SECONDS = 300
+_admin_ids_cache = TTLCache(ttl=ADMIN_IDS_TTL_SECONDS, maxsize=1)
+
+# Emails can't be changed through the API, so a 5 minute TTL is safe
+USER_EMAIL_TTL_SECONDS = 300
+_user_email_cache = TTLCache(ttl=USER_EMAIL_TTL_SECONDS, maxsize=10000)
+
+# Profile rows back the settings pages, which poll - cache them briefly and
+# invalidate on every write to the users row
+USER_PROFILE_TTL_SECONDS = 60
+_user_profile_cache = TTLCache(ttl=USER_PROFILE_TTL_SECONDS, maxsize=50000)
+
 
 async def get_user_email(supabase: Client, user_id: str) -> Optional[str]:
-	"""Get user's email address from database
+	"""Get user's email address, cached in-process with a short TTL
 	
 	Args:
 		supabase: Supabase client instance
@@ -18,16 +33,23 @@ async def get_user_email(supabase: Client, user_id: str) -> Optional[str]:
 	Returns:
 		User's email address or None if not found
 	"""
+	email = _user_email_cache.get(user_id)
+	if email is not None:
+		return email
+	
 	try:
-		result = supabase.table('users').select('email').eq('id', user_id).single().execute()
-		return result.data.get('email') if result.data else None
+		result = await execute_async(supabase.table('users').select('email').eq('id', user_id).limit(1))
+		email = result.data[0].get('email') if result.data else None
+		if email:
+			_user_email_cache.set(user_id, email)
+		return email
 	except Exception as e:
 		logger.error(f"Failed to get email for user {user_id}: {str(e)}")
 		return None
 
 
 async def get_user_profile(supabase: Client, user_id: str) -> Optional[Dict[str, Any]]:
-	"""Get user's full profile from database
+	"""Get user's full profile, cached in-process with a short TTL
 	
 	Args:
 		supabase: Supabase client instance
@@ -36,9 +58,54 @@ async def get_user_profile(supabase: Client, user_id: str) -> Optional[Dict[str,
 	Returns:
 		User profile dict or None if not found
 	"""
+	profile = _user_profile_cache.get(user_id)
+	if profile is not None:
+		return profile
+	
 	try:
-		result = supabase.table('users').select('*').eq('id', user_id).single().execute()
-		return result.data if result.data else None
+		result = await execute_async(supabase.table('users').select('*').eq('id', user_id).limit(1))
+		profile = result.data[0] if result.data else None
+		if profile:
+			_user_profile_cache.set(user_id, profile)
+		return profile
 	except Exception as e:
 		logger.error(f"Failed to get profile for user {user_id}: {str(e)}")
 		return None
+
+
+def invalidate_user_profile(user_id: str) -> None:
+	"""Drop a user's cached profile (call after any update to their users row)
+	
+	Args:
+		user_id: User's unique identifier
+	"""
+	_user_profile_cache.invalidate(user_id)
+
+
+async def get_admin_ids(supabase: Client) -> List[str]:
+	"""Get ids of all admin users, cached in-process with a short TTL
+	
+	Args:
+		supabase: Supabase client instance
+	
+	Returns:
+		List of admin user ids
+	"""
+	admin_ids = _admin_ids_cache.get('admin_ids')
+	if admin_ids is not None:
+		return admin_ids
+	
+	try:
+		result = await execute_async(supabase.table('users').select('id').eq('role', 'admin'))
+		admin_ids = [admin['id'] for admin in result.data or []]
+	except Exception as e:
+		logger.error(f"Failed to get admin ids: {str(e)}")
+		return []
+	
+	_admin_ids_cache.set('admin_ids', admin_ids)
+	return admin_ids
+
+
+def invalidate_admin_ids() -> None:
+	"""Drop the cached admin id list (call after any role change)"""
+	_admin_ids_cache.clear()
@@ -8,7 +8,9 @@ from .email_templates import (
 	transfer_confirmation_email,
 	bill_payment_email,
 	check_deposit_email,
-	check_order_email
+	check_order_email,
+	concierge_request_email,
+	concierge_request_alert_email
 )
 
 __all__ = [
@@ -18,5 +20,7 @@ __all__ = [
 	'transfer_confirmation_email',
 	'bill_payment_email',
 	'check_deposit_email',
-	'check_order_email'
+	'check_order_email',
+	'concierge_request_email',
+	'concierge_request_alert_email'
 ]
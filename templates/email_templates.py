@@ -3,59 +3,38 @@ Professional email templates for Concierge Bank
 Following the established design system for consistent branding and DRY principles
 """
 from core.config import LUXURY_GOLD_COLOR
+from html import escape
 import os
 
+_APP_URL = os.environ.get('NEXT_PUBLIC_APP_URL', 'https://conciergebank.us')
+_UNSUBSCRIBE_URL = f"{_APP_URL}/unsubscribe"
+_PRIVACY_URL = f"{_APP_URL}/privacy"
+_BROWSER_URL = f"{_APP_URL}/email-preview"
 
-def base_email_template(
-    title: str,
-    hero_title: str,
-    content_html: str,
-    hero_subtitle: str = "",
-    cta_text: str = None,
-    cta_url: str = None,
-    footer_text: str = None
-) -> str:
-    """Base email template following Concierge Bank design system"""
-
-    app_url = os.environ.get('NEXT_PUBLIC_APP_URL', 'https://conciergebank.us')
-    unsubscribe_url = f"{app_url}/unsubscribe"
-    privacy_url = f"{app_url}/privacy"
-    browser_url = f"{app_url}/email-preview"
-
-    cta_section = ""
-    if cta_text and cta_url:
-        cta_section = f"""
-                    <!-- CTA Section -->
-                    <tr>
-                        <td class="cta-section">
-                            <a href="{cta_url}" class="cta-button">{cta_text}</a>
-                        </td>
-                    </tr>"""
-
-    footer_content = footer_text or """
-                            This is an automated notification from Concierge Bank.<br>
-                            If you did not request this action, please contact support immediately."""
-
-    return f"""<!DOCTYPE html>
+# Static markup of the base template, built once at import so each render
+# only concatenates the per-email fields instead of re-formatting the whole page
+_HTML_HEAD_OPEN = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <meta http-equiv="X-UA-Compatible" content="IE=edge">
-    <title>{title} - Concierge Bank</title>
+    <title>"""
+
+_HTML_HEAD_CLOSE = """ - Concierge Bank</title>
     <link href="https://fonts.googleapis.com/css2?family=Gruppo&family=Work+Sans:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <!--[if mso]>
     <style type="text/css">
-        table {{border-collapse: collapse; border-spacing: 0; border: 0;}}
+        table {border-collapse: collapse; border-spacing: 0; border: 0;}
     </style>
     <![endif]-->
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
-        body {{
+        }
+        body {
             margin: 0 !important;
             padding: 0 !important;
             font-family: 'Work Sans', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif;
@@ -63,18 +42,18 @@ def base_email_template(
             width: 100% !important;
             -webkit-text-size-adjust: 100%;
             -ms-text-size-adjust: 100%;
-        }}
-        table {{
+        }
+        table {
             border-spacing: 0 !important;
             border-collapse: collapse !important;
             table-layout: fixed !important;
             margin: 0 auto !important;
-        }}
-        td {{
+        }
+        td {
             padding: 0;
             vertical-align: top;
-        }}
-        img {{
+        }
+        img {
             border: 0;
             display: block;
             max-width: 100%;
@@ -83,44 +62,44 @@ def base_email_template(
             outline: none;
             text-decoration: none;
             -ms-interpolation-mode: bicubic;
-        }}
-        a {{
+        }
+        a {
             text-decoration: none;
-        }}
-        .email-container {{
+        }
+        .email-container {
             max-width: 600px;
             margin: 0 auto;
             background: #FEFDFB;
             width: 100%;
-        }}
+        }
 
         /* Header with Logo */
-        .header-section {{
+        .header-section {
             background: linear-gradient(135deg, #FEFDFB 0%, #FAF9F7 100%);
             padding: 30px 40px;
             text-align: center;
             border-bottom: 3px solid #F2CA27;
-        }}
-        .header-section img {{
+        }
+        .header-section img {
             max-width: 300px;
             width: 100%;
             height: auto;
             margin: 0 auto;
-        }}
+        }
 
         /* Hero Image Section */
-        .hero-image-section {{
+        .hero-image-section {
             position: relative;
             overflow: hidden;
             background: #1a1a1a;
-        }}
-        .hero-image {{
+        }
+        .hero-image {
             width: 100%;
             height: auto;
             display: block;
             opacity: 0.9;
-        }}
-        .hero-overlay {{
+        }
+        .hero-overlay {
             position: absolute;
             top: 0;
             left: 0;
@@ -131,8 +110,8 @@ def base_email_template(
             align-items: center;
             justify-content: center;
             padding: 60px 40px;
-        }}
-        .hero-title {{
+        }
+        .hero-title {
             font-family: 'Gruppo', sans-serif;
             font-size: 48px;
             font-weight: 400;
@@ -142,37 +121,37 @@ def base_email_template(
             line-height: 1.2;
             text-shadow: 2px 2px 8px rgba(0, 0, 0, 0.5);
             letter-spacing: 1px;
-        }}
+        }
 
         /* Content Section */
-        .content-section {{
+        .content-section {
             padding: 50px 40px;
             background: #FEFDFB;
             color: #1a1a1a;
             line-height: 1.8;
-        }}
-        .content-title {{
+        }
+        .content-title {
             font-family: 'Gruppo', sans-serif;
             font-size: 28px;
             color: #1a1a1a;
             margin: 0 0 20px 0;
             letter-spacing: 1px;
-        }}
-        .content-text {{
+        }
+        .content-text {
             font-family: 'Work Sans', sans-serif;
             font-size: 16px;
             color: #404040;
             margin: 0 0 20px 0;
             line-height: 1.8;
-        }}
+        }
 
         /* CTA Button */
-        .cta-section {{
+        .cta-section {
             padding: 40px;
             text-align: center;
             background: linear-gradient(135deg, #FAF9F7 0%, #F5F3F0 100%);
-        }}
-        .cta-button {{
+        }
+        .cta-button {
             display: inline-block;
             padding: 16px 48px;
             background: linear-gradient(135deg, #F2CA27 0%, #EBA420 100%);
@@ -185,57 +164,57 @@ def base_email_template(
             transition: all 0.3s ease;
             box-shadow: 0 4px 12px rgba(242, 202, 39, 0.3);
             letter-spacing: 0.5px;
-        }}
-        .cta-button:hover {{
+        }
+        .cta-button:hover {
             background: linear-gradient(135deg, #EBA420 0%, #D08C1D 100%);
             box-shadow: 0 6px 16px rgba(242, 202, 39, 0.4);
             transform: translateY(-2px);
-        }}
+        }
 
         /* Info Box */
-        .info-box {{
+        .info-box {
             background: #F5F3F0;
             border-left: 4px solid #F2CA27;
             padding: 20px;
             margin: 25px 0;
-        }}
-        .info-title {{
+        }
+        .info-title {
             font-family: 'Work Sans', sans-serif;
             font-size: 16px;
             font-weight: 600;
             color: #1a1a1a;
             margin: 0 0 10px 0;
-        }}
-        .info-text {{
+        }
+        .info-text {
             font-family: 'Work Sans', sans-serif;
             font-size: 14px;
             color: #525252;
             margin: 0;
             line-height: 1.6;
-        }}
+        }
 
         /* Transaction Details */
-        .transaction-details {{
+        .transaction-details {
             background: #FAF9F7;
             border: 1px solid #E8E6E3;
             border-radius: 8px;
             padding: 25px;
             margin: 30px 0;
-        }}
-        .transaction-title {{
+        }
+        .transaction-title {
             font-family: 'Work Sans', sans-serif;
             font-size: 18px;
             font-weight: 600;
             color: #1a1a1a;
             margin: 0 0 15px 0;
-        }}
-        .transaction-item {{
+        }
+        .transaction-item {
             display: table;
             width: 100%;
             border-collapse: collapse;
             margin-bottom: 10px;
-        }}
-        .transaction-label {{
+        }
+        .transaction-label {
             display: table-cell;
             padding: 8px 12px 8px 0;
             font-family: 'Work Sans', sans-serif;
@@ -243,124 +222,124 @@ def base_email_template(
             color: #1a1a1a;
             width: 40%;
             vertical-align: top;
-        }}
-        .transaction-value {{
+        }
+        .transaction-value {
             display: table-cell;
             padding: 8px 0;
             font-family: 'Work Sans', sans-serif;
             color: #525252;
-        }}
+        }
 
         /* Divider */
-        .divider {{
+        .divider {
             height: 2px;
             background: linear-gradient(90deg, transparent 0%, #F2CA27 50%, transparent 100%);
             margin: 40px 0;
-        }}
+        }
 
         /* Footer Section */
-        .footer-section {{
+        .footer-section {
             background: #1a1a1a;
             padding: 40px 40px 30px 40px;
             text-align: center;
             color: #FAF9F7;
             font-size: 14px;
             line-height: 1.6;
-        }}
-        .footer-section img {{
+        }
+        .footer-section img {
             max-width: 200px;
             width: 100%;
             height: auto;
             margin: 0 auto 20px auto;
             opacity: 0.9;
-        }}
-        .footer-text {{
+        }
+        .footer-text {
             font-family: 'Work Sans', sans-serif;
             margin: 10px 0;
             color: #E8E6E3;
-        }}
-        .footer-links {{
+        }
+        .footer-links {
             margin: 20px 0 10px 0;
-        }}
-        .footer-links a {{
+        }
+        .footer-links a {
             color: #F2CA27;
             text-decoration: none;
             margin: 0 10px;
             font-weight: 500;
-        }}
-        .footer-links a:hover {{
+        }
+        .footer-links a:hover {
             color: #FFD54F;
             text-decoration: underline;
-        }}
-        .footer-address {{
+        }
+        .footer-address {
             font-family: 'Work Sans', sans-serif;
             font-size: 12px;
             color: #a3a3a3;
             margin: 15px 0 0 0;
             font-style: normal;
-        }}
+        }
 
         /* Responsive Design */
-        @media only screen and (max-width: 600px) {{
-            .email-container {{
+        @media only screen and (max-width: 600px) {
+            .email-container {
                 width: 100% !important;
-            }}
-            .header-section {{
+            }
+            .header-section {
                 padding: 25px 20px !important;
-            }}
-            .header-section img {{
+            }
+            .header-section img {
                 max-width: 250px !important;
-            }}
-            .hero-overlay {{
+            }
+            .hero-overlay {
                 padding: 40px 20px !important;
-            }}
-            .hero-title {{
+            }
+            .hero-title {
                 font-size: 32px !important;
-            }}
-            .content-section {{
+            }
+            .content-section {
                 padding: 40px 25px !important;
-            }}
-            .content-title {{
+            }
+            .content-title {
                 font-size: 24px !important;
-            }}
-            .content-text {{
+            }
+            .content-text {
                 font-size: 15px !important;
-            }}
-            .transaction-item {{
+            }
+            .transaction-item {
                 display: block !important;
-            }}
-            .transaction-label, .transaction-value {{
+            }
+            .transaction-label, .transaction-value {
                 display: block !important;
                 width: 100% !important;
                 padding: 4px 0 !important;
-            }}
-            .cta-section {{
+            }
+            .cta-section {
                 padding: 30px 20px !important;
-            }}
-            .cta-button {{
+            }
+            .cta-button {
                 padding: 14px 36px !important;
                 font-size: 15px !important;
-            }}
-            .footer-section {{
+            }
+            .footer-section {
                 padding: 30px 20px 25px 20px !important;
-            }}
-            .footer-section img {{
+            }
+            .footer-section img {
                 max-width: 180px !important;
-            }}
-        }}
+            }
+        }
 
-        @media only screen and (max-width: 480px) {{
-            .hero-title {{
+        @media only screen and (max-width: 480px) {
+            .hero-title {
                 font-size: 28px !important;
-            }}
-            .content-title {{
+            }
+            .content-title {
                 font-size: 22px !important;
-            }}
-            .cta-button {{
+            }
+            .cta-button {
                 padding: 12px 32px !important;
                 font-size: 14px !important;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body style="margin: 0; padding: 0; background-color: #FEFDFB;">
@@ -381,7 +360,9 @@ def base_email_template(
                         <td class="hero-image-section" style="position: relative;">
                             <img src="https://www.richemont.com/media/vy0f4smm/richemont-hq-entrance-evening-_subpage.png" alt="Concierge Bank" class="hero-image" style="width: 600px; height: 400px; object-fit: cover;">
                             <div class="hero-overlay">
-                                <h1 class="hero-title">{hero_title}</h1>
+                                <h1 class="hero-title">"""
+
+_HTML_HERO_CLOSE = """</h1>
                             </div>
                         </td>
                     </tr>
@@ -389,20 +370,26 @@ def base_email_template(
                     <!-- Content Section -->
                     <tr>
                         <td class="content-section">
-                            {content_html}
+                            """
+
+_HTML_CONTENT_CLOSE = """
                         </td>
-                    </tr>{cta_section}
+                    </tr>"""
+
+_HTML_FOOTER_OPEN = """
 
                     <!-- Footer Section -->
                     <tr>
                         <td class="footer-section">
                             <img src="https://conciergebank.us/_next/image?url=%2Flogos%2Fbanner.png&w=3840&q=75" alt="Concierge Bank" style="max-width: 200px; height: auto; margin: 0 auto 20px auto; opacity: 0.9;">
-                            <p class="footer-text">{footer_content}</p>
+                            <p class="footer-text">"""
+
+_HTML_FOOTER_CLOSE = f"""</p>
 
                             <div class="footer-links">
-                                <a href="{unsubscribe_url}">Unsubscribe</a> |
-                                <a href="{browser_url}">View in Browser</a> |
-                                <a href="{privacy_url}">Privacy Policy</a>
+                                <a href="{_UNSUBSCRIBE_URL}">Unsubscribe</a> |
+                                <a href="{_BROWSER_URL}">View in Browser</a> |
+                                <a href="{_PRIVACY_URL}">Privacy Policy</a>
                             </div>
 
                             <p class="footer-address">
@@ -419,6 +406,38 @@ def base_email_template(
 </html>"""
 
 
+def base_email_template(
+    title: str,
+    hero_title: str,
+    content_html: str,
+    hero_subtitle: str = "",
+    cta_text: str = None,
+    cta_url: str = None,
+    footer_text: str = None
+) -> str:
+    """Base email template following Concierge Bank design system"""
+
+    cta_section = ""
+    if cta_text and cta_url:
+        cta_section = f"""
+                    <!-- CTA Section -->
+                    <tr>
+                        <td class="cta-section">
+                            <a href="{cta_url}" class="cta-button">{cta_text}</a>
+                        </td>
+                    </tr>"""
+
+    footer_content = footer_text or """
+                            This is an automated notification from Concierge Bank.<br>
+                            If you did not request this action, please contact support immediately."""
+
+    return (
+        f"{_HTML_HEAD_OPEN}{title}{_HTML_HEAD_CLOSE}{hero_title}{_HTML_HERO_CLOSE}"
+        f"{content_html}{_HTML_CONTENT_CLOSE}{cta_section}"
+        f"{_HTML_FOOTER_OPEN}{footer_content}{_HTML_FOOTER_CLOSE}"
+    )
+
+
 def welcome_email(full_name: str) -> str:
     """Professional welcome email for new Concierge Bank members"""
 
@@ -431,15 +450,13 @@ def welcome_email(full_name: str) -> str:
                                 Experience banking that adapts to your lifestyle, with dedicated advisors ready to help you achieve your financial goals.
                             </p>"""
 
-    app_url = os.environ.get('NEXT_PUBLIC_APP_URL', 'https://conciergebank.us')
-
     return base_email_template(
         title="Welcome to Concierge Bank",
         hero_title="Welcome to Excellence",
         content_html=content_html,
         hero_subtitle="",  # Not used in new template
         cta_text="Explore Our Services",
-        cta_url=f"{app_url}",
+        cta_url=_APP_URL,
         footer_text="Welcome to Concierge Bank! Your account is now active and ready for use."
     )
 
@@ -480,14 +497,12 @@ def account_created_email(account_type: str, account_number: str, initial_deposi
                                 </ul>
                             </div>"""
 
-    app_url = os.environ.get('NEXT_PUBLIC_APP_URL', 'https://conciergebank.us')
-
     return base_email_template(
         title="Account Created",
         hero_title="Account Opened Successfully",
         content_html=content_html,
         cta_text="View Account Details",
-        cta_url=f"{app_url}/dashboard/accounts",
+        cta_url=f"{_APP_URL}/dashboard/accounts",
         footer_text="Your new account is active and ready for transactions."
     )
 
@@ -532,14 +547,12 @@ def card_approved_email(card_brand: str, card_type: str, card_last_four: str, cr
                                 </ul>
                             </div>"""
 
-    app_url = os.environ.get('NEXT_PUBLIC_APP_URL', 'https://conciergebank.us')
-
     return base_email_template(
         title="Card Approved",
         hero_title="Card Application Approved",
         content_html=content_html,
         cta_text="Manage Cards",
-        cta_url=f"{app_url}/dashboard/cards",
+        cta_url=f"{_APP_URL}/dashboard/cards",
         footer_text="Your new card is on its way! Track delivery status in your dashboard."
     )
 
@@ -608,8 +621,6 @@ def transfer_confirmation_email(amount: float, new_balance: float, recipient_nam
                                 </p>
                             </div>"""
 
-    app_url = os.environ.get('NEXT_PUBLIC_APP_URL', 'https://conciergebank.us')
-    
     footer_note = "Your transfer has been completed. Funds are available immediately." if status == 'completed' else f"Your transfer is {status}. {processing_note}"
 
     return base_email_template(
@@ -617,7 +628,7 @@ def transfer_confirmation_email(amount: float, new_balance: float, recipient_nam
         hero_title=hero_title,
         content_html=content_html,
         cta_text="View Transaction History",
-        cta_url=f"{app_url}/dashboard/accounts",
+        cta_url=f"{_APP_URL}/dashboard/accounts",
         footer_text=footer_note
     )
 
@@ -660,14 +671,12 @@ def bill_payment_email(payee_name: str, amount: float, payment_date: str) -> str
                                 </p>
                             </div>"""
 
-    app_url = os.environ.get('NEXT_PUBLIC_APP_URL', 'https://conciergebank.us')
-
     return base_email_template(
         title="Bill Payment Confirmation",
         hero_title="Bill Payment Completed",
         content_html=content_html,
         cta_text="Manage Bill Payments",
-        cta_url=f"{app_url}/dashboard/bills",
+        cta_url=f"{_APP_URL}/dashboard/bills",
         footer_text="Your bill payment has been completed. Keep this confirmation for your records."
     )
 
@@ -720,14 +729,12 @@ def check_deposit_email(amount: float, check_number: str) -> str:
                                 </p>
                             </div>"""
 
-    app_url = os.environ.get('NEXT_PUBLIC_APP_URL', 'https://conciergebank.us')
-
     return base_email_template(
         title="Check Deposit Confirmation",
         hero_title="Check Deposit Received",
         content_html=content_html,
         cta_text="Track Deposit Status",
-        cta_url=f"{app_url}/dashboard/deposits",
+        cta_url=f"{_APP_URL}/dashboard/deposits",
         footer_text="Your check deposit is being processed. Track the status in your dashboard."
     )
 
@@ -778,13 +785,38 @@ def check_order_email(design: str, quantity: int, price: float) -> str:
                                 </p>
                             </div>"""
 
-    app_url = os.environ.get('NEXT_PUBLIC_APP_URL', 'https://conciergebank.us')
-
     return base_email_template(
         title="Check Order Confirmation",
         hero_title="Check Order Received",
         content_html=content_html,
         cta_text="Reorder Checks",
-        cta_url=f"{app_url}/dashboard/checks",
+        cta_url=f"{_APP_URL}/dashboard/checks",
         footer_text="Your check order is being processed. You'll receive shipping updates via email."
     )
+
+
+def concierge_request_email(request_type: str, details: str) -> str:
+    """Concierge request confirmation snippet for the requesting user
+
+    User-supplied fields are HTML-escaped (after str(), since JSON bodies
+    may carry non-string values).
+    """
+    return (
+        f"<p>Thank you for your {escape(str(request_type))} request.</p>"
+        f"<p><strong>Details:</strong> {escape(str(details))}</p>"
+        "<p>Our concierge team will review your request and contact you within 24 hours.</p>"
+    )
+
+
+def concierge_request_alert_email(request_type: str, user_id: str, details: str) -> str:
+    """Concierge request alert snippet for the admin/concierge team
+
+    Rendered once per request and shared by every admin notification.
+    User-supplied fields are HTML-escaped.
+    """
+    return (
+        f"<p><strong>Request Type:</strong> {escape(str(request_type))}</p>"
+        f"<p><strong>User:</strong> {escape(str(user_id))}</p>"
+        f"<p><strong>Details:</strong> {escape(str(details))}</p>"
+        "<p>Please review and respond promptly.</p>"
+    )
@@ -2,7 +2,14 @@
 Utility functions package
 """
 from .generators import generate_card_number, generate_account_number, generate_cvv
-from .validators import luhn_checksum, digits_of
+from .validators import (
+    luhn_checksum,
+    digits_of,
+    is_valid_pin,
+    PIN_RE,
+    ROUTING_NUMBER_RE,
+    EXTERNAL_ACCOUNT_NUMBER_RE
+)
 from .db_helpers import (
     verify_account_ownership,
     check_sufficient_balance,
@@ -12,6 +19,7 @@ from .db_helpers import (
     get_user_records
 )
 from .bot_prevention import validate_bot_prevention
+from .cache import TTLCache
 
 __all__ = [
     'generate_card_number',
@@ -19,11 +27,16 @@ __all__ = [
     'generate_cvv',
     'luhn_checksum',
     'digits_of',
+    'is_valid_pin',
+    'PIN_RE',
+    'ROUTING_NUMBER_RE',
+    'EXTERNAL_ACCOUNT_NUMBER_RE',
     'verify_account_ownership',
     'check_sufficient_balance',
     'update_account_balance',
     'create_transaction_record',
     'insert_record',
     'get_user_records',
-    'validate_bot_prevention'
+    'validate_bot_prevention',
+    'TTLCache'
 ]
@@ -0,0 +1,41 @@
+"""
+Simple in-process TTL cache
+Used to avoid repeated Supabase round-trips for data that changes rarely
+In production with multiple workers, use Redis or similar for shared caching
+"""
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+	"""Dictionary cache whose entries expire after a fixed number of seconds"""
+
+	def __init__(self, ttl: float, maxsize: int = 1024):
+		self.ttl = ttl
+		self.maxsize = maxsize
+		self._store: Dict[Hashable, Tuple[float, Any]] = {}
+
+	def get(self, key: Hashable) -> Optional[Any]:
+		"""Get cached value, or None if missing or expired"""
+		entry = self._store.get(key)
+		if entry is None:
+			return None
+		expires_at, value = entry
+		if expires_at < time.monotonic():
+			self._store.pop(key, None)
+			return None
+		return value
+
+	def set(self, key: Hashable, value: Any) -> None:
+		"""Cache value for key, evicting the oldest entry when full"""
+		if key not in self._store and len(self._store) >= self.maxsize:
+			self._store.pop(next(iter(self._store)))
+		self._store[key] = (time.monotonic() + self.ttl, value)
+
+	def invalidate(self, key: Hashable) -> None:
+		"""Drop a single cached entry"""
+		self._store.pop(key, None)
+
+	def clear(self) -> None:
+		"""Drop all cached entries"""
+		self._store.clear()
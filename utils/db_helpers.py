@@ -4,8 +4,9 @@ Reduces code duplication across routes
 """
 import logging
 from typing import Optional, Dict, Any, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 from supabase import Client
+from core import execute_async
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +27,7 @@ async def verify_account_ownership(
 		Tuple of (success, account_data, error_message)
 	"""
 	try:
-		result = supabase.table('accounts').select('*').eq('id', account_id).eq('user_id', user_id).single().execute()
+		result = await execute_async(supabase.table('accounts').select('*').eq('id', account_id).eq('user_id', user_id).single())
 		if not result.data:
 			return False, None, 'Account not found'
 		return True, result.data, None
@@ -65,10 +66,10 @@ async def update_account_balance(
 		account_id: Account identifier
 		new_balance: New balance amount
 	"""
-	supabase.table('accounts').update({
+	await execute_async(supabase.table('accounts').update({
 		'balance': new_balance,
-		'updated_at': datetime.utcnow().isoformat()
-	}).eq('id', account_id).execute()
+		'updated_at': datetime.now(timezone.utc).isoformat()
+	}).eq('id', account_id))
 
 
 async def create_transaction_record(
@@ -100,13 +101,13 @@ async def create_transaction_record(
 		'amount': amount,
 		'description': description,
 		'category': category,
-		'created_at': datetime.utcnow().isoformat()
+		'created_at': datetime.now(timezone.utc).isoformat()
 	}
 	
 	if merchant:
 		transaction_data['merchant'] = merchant
 	
-	result = supabase.table('transactions').insert(transaction_data).execute()
+	result = await execute_async(supabase.table('transactions').insert(transaction_data))
 	return result.data[0]
 
 
@@ -128,9 +129,9 @@ async def insert_record(
 		Created record data
 	"""
 	if add_timestamp and 'created_at' not in data:
-		data['created_at'] = datetime.utcnow().isoformat()
+		data['created_at'] = datetime.now(timezone.utc).isoformat()
 	
-	result = supabase.table(table).insert(data).execute()
+	result = await execute_async(supabase.table(table).insert(data))
 	return result.data[0]
 
 
@@ -158,5 +159,5 @@ async def get_user_records(
 	if order_by:
 		query = query.order(order_by, desc=desc)
 	
-	result = query.execute()
+	result = await execute_async(query)
 	return result.data
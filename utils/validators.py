@@ -1,7 +1,26 @@
 """
 Validation utilities
 """
-from typing import List
+import re
+from typing import Any, List
+
+# Compiled once at import. [0-9] rather than \d/isdigit() so only ASCII
+# digits pass (isdigit() also accepts e.g. Arabic-Indic or superscript digits)
+PIN_RE = re.compile(r'[0-9]{6}')
+ROUTING_NUMBER_RE = re.compile(r'[0-9]{9}')
+EXTERNAL_ACCOUNT_NUMBER_RE = re.compile(r'[0-9]{4,}')
+
+
+def is_valid_pin(pin: Any) -> bool:
+	"""Check that a transaction PIN is a string of exactly 6 ASCII digits
+	
+	Args:
+		pin: Value supplied by the client
+	
+	Returns:
+		True if the PIN is well-formed
+	"""
+	return isinstance(pin, str) and PIN_RE.fullmatch(pin) is not None
 
 
 def digits_of(n: int) -> List[int]: